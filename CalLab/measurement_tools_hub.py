@@ -109,9 +109,65 @@ except ImportError:
 
 
 
+# Status bar text for each page of the stacked widget, by index
+PAGE_STATUS_MESSAGES = (
+    "Home - Select an instrument to begin",
+    "Agilent 53132 Universal Counter - Frequency and time measurements",
+    "FLUKE 8846A Precision Multimeter - Voltage, current, and resistance",
+    "HP 3458A Multimeter - High-precision measurement",
+    "Oscilloscope - Under development",
+    "Power Supply - Under development",
+    "Signal Generator - Under development",
+    "Spectrum Analyzer - Under development",
+    "HP 34401A Multimeter - 6.5-digit precision measurement",
+    "Fluke 8508A Reference Multimeter - 8.5-digit reference measurement",
+    "Keysight 34465A Multimeter - 6.5-digit Truevolt with Temperature/Capacitance",
+    "Rohde & Schwarz Power Meter - Precision Power Measurement (dBm/W)",
+    "HP/Agilent 33120A Waveform Generator",
+    "Agilent N1996A CSA Spectrum Analyzer - 100 kHz to 3 GHz",
+    "Fluke 1620A Environment Monitor - Real-time Temperature & Humidity",
+    "DC/RF Calibration Simulator - Interactive Calibration Training Platform",
+    "Keysight 34461A Multimeter - 6.5-digit Truevolt DMM",
+    "Keysight 33500B Waveform Generator - 30 MHz dual-channel function/arbitrary waveform generator",
+)
+
+
 class InstrumentCard(QFrame):
     """Card widget for each instrument"""
     
+    # Professional lab equipment styling. The home page sets this once on the
+    # widget that holds all the cards, so Qt parses it once instead of per card.
+    CARD_QSS = """
+        InstrumentCard {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #ffffff, stop:1 #f9fafb);
+            border: 1px solid #d1d5db;
+            border-radius: 12px;
+        }
+        InstrumentCard:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #ffffff, stop:1 #f0f4f8);
+            border: 1px solid #3498db;
+            transform: translateY(-2px);
+        }
+    """
+    
+    # Card status -> (LED/label colour, label text); anything else shows as Offline
+    STATUS_STYLES = {
+        "Available": ("#27ae60", "Ready"),
+        "Coming Soon": ("#f39c12", "In Development"),
+        "Not Ready": ("#e67e22", "Not Ready"),
+        "Not Available": ("#e67e22", "Not Available"),
+    }
+    OFFLINE_STYLE = ("#95a5a6", "Offline")
+    
+    SHADOW_COLOR = QColor(0, 0, 0, 25)  # Subtle dark shadow
+    
+    # Fonts shared by every card, created with the first card (needs a QApplication)
+    _fonts = None
+    
+    clicked = pyqtSignal()
+    
     def __init__(self, title, description, icon, status="Available", parent=None):
         super().__init__(parent)
         self.title = title
@@ -120,32 +176,30 @@ class InstrumentCard(QFrame):
         self.status = status
         self.setup_ui()
     
+    @classmethod
+    def _shared_fonts(cls):
+        """Return the (icon, title, description, led, status) fonts"""
+        if cls._fonts is None:
+            cls._fonts = (
+                QFont("Segoe UI Emoji", 26),
+                QFont("Segoe UI", 13, QFont.Weight.DemiBold),
+                QFont("Segoe UI", 9),
+                QFont("Segoe UI", 12),
+                QFont("Consolas", 9, QFont.Weight.Medium),
+            )
+        return cls._fonts
+    
     def setup_ui(self):
         """Setup the card UI"""
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
+        icon_font, title_font, desc_font, led_font, status_font = self._shared_fonts()
         
-        # Professional lab equipment styling
-        self.setStyleSheet("""
-            InstrumentCard {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f9fafb);
-                border: 1px solid #d1d5db;
-                border-radius: 12px;
-            }
-            InstrumentCard:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f0f4f8);
-                border: 1px solid #3498db;
-                transform: translateY(-2px);
-            }
-        """)
-        
-        # Professional shadow effect
+        # Professional shadow effect (an effect belongs to one widget, so each card has its own)
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(12)
         shadow.setXOffset(0)
         shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 25))  # Subtle dark shadow
+        shadow.setColor(self.SHADOW_COLOR)
         self.setGraphicsEffect(shadow)
         
         self.setMinimumHeight(180)
@@ -160,14 +214,14 @@ class InstrumentCard(QFrame):
         header_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         icon_label = QLabel(self.icon)
-        icon_label.setFont(QFont("Segoe UI Emoji", 26))
+        icon_label.setFont(icon_font)
         icon_label.setStyleSheet("color: #4b5563;")
         header_layout.addWidget(icon_label)
         
         header_layout.addSpacing(12)
         
         title_label = QLabel(self.title)
-        title_label.setFont(QFont("Segoe UI", 13, QFont.Weight.DemiBold))
+        title_label.setFont(title_font)
         title_label.setStyleSheet("color: #4b5563; letter-spacing: 0.3px;")
         title_label.setWordWrap(True)
         header_layout.addWidget(title_label, 1)
@@ -176,7 +230,7 @@ class InstrumentCard(QFrame):
         
         # Description
         desc_label = QLabel(self.description)
-        desc_label.setFont(QFont("Segoe UI", 9))
+        desc_label.setFont(desc_font)
         desc_label.setStyleSheet("color: #6b7280; line-height: 1.5;")
         desc_label.setWordWrap(True)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
@@ -186,39 +240,27 @@ class InstrumentCard(QFrame):
         status_container = QHBoxLayout()
         status_container.setSpacing(8)
         
+        status_color, status_text = self.STATUS_STYLES.get(self.status, self.OFFLINE_STYLE)
+        
         # LED indicator dot
         led_label = QLabel("●")
-        led_label.setFont(QFont("Segoe UI", 12))
-        
-        if self.status == "Available":
-            led_label.setStyleSheet("color: #27ae60;")
-            status_text = "Ready"
-            status_color = "#27ae60"
-        elif self.status == "Coming Soon":
-            led_label.setStyleSheet("color: #f39c12;")
-            status_text = "In Development"
-            status_color = "#f39c12"
-        elif self.status == "Not Ready":
-            led_label.setStyleSheet("color: #e67e22;")
-            status_text = "Not Ready"
-            status_color = "#e67e22"
-        elif self.status == "Not Available":
-            led_label.setStyleSheet("color: #e67e22;")
-            status_text = "Not Available"
-            status_color = "#e67e22"
-        else:
-            led_label.setStyleSheet("color: #95a5a6;")
-            status_text = "Offline"
-            status_color = "#95a5a6"
+        led_label.setFont(led_font)
+        led_label.setStyleSheet(f"color: {status_color};")
         
         status_label = QLabel(status_text)
-        status_label.setFont(QFont("Consolas", 9, QFont.Weight.Medium))
+        status_label.setFont(status_font)
         status_label.setStyleSheet(f"color: {status_color}; letter-spacing: 0.5px;")
         
         status_container.addWidget(led_label)
         status_container.addWidget(status_label)
         status_container.addStretch()
         layout.addLayout(status_container)
+    
+    def mousePressEvent(self, event):
+        """Emit clicked for a left click anywhere on the card"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
 
 
 class MultimeterWidget(QWidget):
@@ -1143,9 +1185,48 @@ class InstrumentGuidePanel(QFrame):
 class MeasurementToolsHub(QMainWindow):
     """Main hub window for all measurement instruments"""
     
+    # Header badge styles; the badge for the current page is shown as active
+    _HEADER_BADGE_ACTIVE = """
+        QPushButton {
+            color: #4A90E2;
+            background-color: white;
+            border: 2px solid white;
+            border-radius: 4px;
+            padding: 6px 14px;
+            letter-spacing: 1.5px;
+        }
+        QPushButton:hover {
+            color: white;
+            background-color: rgba(255, 255, 255, 0.30);
+            border: 2px solid white;
+        }
+        QPushButton:pressed {
+            background-color: rgba(255, 255, 255, 0.55);
+            color: #1a73e8;
+        }
+    """
+    _HEADER_BADGE_INACTIVE = """
+        QPushButton {
+            color: white;
+            background-color: rgba(255, 255, 255, 0.18);
+            border: 1px solid rgba(255, 255, 255, 0.35);
+            border-radius: 4px;
+            padding: 6px 14px;
+            letter-spacing: 1.5px;
+        }
+        QPushButton:hover {
+            background-color: rgba(255, 255, 255, 0.35);
+            border: 1px solid rgba(255, 255, 255, 0.60);
+        }
+        QPushButton:pressed {
+            background-color: rgba(255, 255, 255, 0.55);
+        }
+    """
+
     def __init__(self):
         super().__init__()
         self.current_instrument = None
+        self._cal_sim_page_active = None  # header badge state last applied by _update_header_active_state
         self.init_ui()
     
     def init_ui(self):
@@ -1868,6 +1949,7 @@ class MeasurementToolsHub(QMainWindow):
         """)
         
         scroll_content = QWidget()
+        scroll_content.setStyleSheet(InstrumentCard.CARD_QSS)
         grid_layout = QGridLayout(scroll_content)
         grid_layout.setSpacing(20)
         grid_layout.setContentsMargins(4, 4, 4, 4)
@@ -1906,7 +1988,7 @@ class MeasurementToolsHub(QMainWindow):
         for title, desc, icon, status, index in instruments:
             card = InstrumentCard(title, desc, icon, status)
             card.setCursor(Qt.CursorShape.PointingHandCursor)
-            card.mousePressEvent = lambda event, idx=index: self.switch_page(idx)
+            card.clicked.connect(lambda idx=index: self.switch_page(idx))
             grid_layout.addWidget(card, row, col)
 
             
@@ -1936,6 +2018,7 @@ class MeasurementToolsHub(QMainWindow):
         """Open the Calibration Simulator as a separate standalone window"""
         # Brief flash feedback
         self.cal_sim_btn.setStyleSheet(self._cal_sim_active_style)
+        self._cal_sim_page_active = None  # the flash overrides the badge styles; restyle on next switch
         
         # Open (or bring to front) the standalone Cal Sim window
         if not hasattr(self, '_cal_sim_window') or self._cal_sim_window is None:
@@ -1957,77 +2040,26 @@ class MeasurementToolsHub(QMainWindow):
         self.stacked_widget.setCurrentIndex(index)
         
         # Update status bar
-        pages = [
-            "Home - Select an instrument to begin",
-            "Agilent 53132 Universal Counter - Frequency and time measurements",
-            "FLUKE 8846A Precision Multimeter - Voltage, current, and resistance",
-            "HP 3458A Multimeter - High-precision measurement",
-            "Oscilloscope - Under development",
-            "Power Supply - Under development",
-            "Signal Generator - Under development",
-            "Spectrum Analyzer - Under development",
-            "HP 34401A Multimeter - 6.5-digit precision measurement",
-            "Fluke 8508A Reference Multimeter - 8.5-digit reference measurement",
-            "Keysight 34465A Multimeter - 6.5-digit Truevolt with Temperature/Capacitance",
-            "Rohde & Schwarz Power Meter - Precision Power Measurement (dBm/W)",
-            "HP/Agilent 33120A Waveform Generator",
-            "Agilent N1996A CSA Spectrum Analyzer - 100 kHz to 3 GHz",
-            "Fluke 1620A Environment Monitor - Real-time Temperature & Humidity",
-            "DC/RF Calibration Simulator - Interactive Calibration Training Platform",
-            "Keysight 34461A Multimeter - 6.5-digit Truevolt DMM",
-            "Keysight 33500B Waveform Generator - 30 MHz dual-channel function/arbitrary waveform generator"
-        ]
-        
-        if index < len(pages):
-            self.status_bar.showMessage(pages[index])
+        if index < len(PAGE_STATUS_MESSAGES):
+            self.status_bar.showMessage(PAGE_STATUS_MESSAGES[index])
         
         # Toggle CAL SIM / CAL-LAB active visual state
         self._update_header_active_state(index)
     
     def _update_header_active_state(self, index):
         """Swap active/inactive styles between CAL SIM and CAL-LAB based on current page"""
-        _active = """
-            QPushButton {
-                color: #4A90E2;
-                background-color: white;
-                border: 2px solid white;
-                border-radius: 4px;
-                padding: 6px 14px;
-                letter-spacing: 1.5px;
-            }
-            QPushButton:hover {
-                color: white;
-                background-color: rgba(255, 255, 255, 0.30);
-                border: 2px solid white;
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.55);
-                color: #1a73e8;
-            }
-        """
-        _inactive = """
-            QPushButton {
-                color: white;
-                background-color: rgba(255, 255, 255, 0.18);
-                border: 1px solid rgba(255, 255, 255, 0.35);
-                border-radius: 4px;
-                padding: 6px 14px;
-                letter-spacing: 1.5px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.35);
-                border: 1px solid rgba(255, 255, 255, 0.60);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.55);
-            }
-        """
-        if index == 15:   # Cal Sim page is active
-            self.cal_sim_btn.setStyleSheet(_active)
-            self.cal_lab_btn.setStyleSheet(_inactive)
-        else:             # Any other page — CAL-LAB is the "home" badge
-            self.cal_sim_btn.setStyleSheet(_inactive)
-            self.cal_lab_btn.setStyleSheet(_active)
+        # Pages are built once in the stack, so a switch is just setCurrentIndex;
+        # only re-polish the header badges when the Cal Sim state actually flips
+        cal_sim_active = index == 15
+        if cal_sim_active == self._cal_sim_page_active:
+            return
+        self._cal_sim_page_active = cal_sim_active
+        if cal_sim_active:  # Cal Sim page is active
+            self.cal_sim_btn.setStyleSheet(self._HEADER_BADGE_ACTIVE)
+            self.cal_lab_btn.setStyleSheet(self._HEADER_BADGE_INACTIVE)
+        else:               # Any other page — CAL-LAB is the "home" badge
+            self.cal_sim_btn.setStyleSheet(self._HEADER_BADGE_INACTIVE)
+            self.cal_lab_btn.setStyleSheet(self._HEADER_BADGE_ACTIVE)
     
 
 
@@ -1,44 +1,166 @@
 """
 HP 3458A Multimeter – 3D Instrument Panel GUI
 Redesigned to mimic the physical front panel of the HP 3458A.
-All measurement logic is identical to multimeter_3458_gui.py.
+Measurement settings follow multimeter_3458_gui.py; readings are taken
+as binary bursts paced by the meter.
 """
 
 import sys
 import traceback
 import csv
+from collections import deque
+import importlib.util
 import os
 import subprocess
+import struct
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLabel, QComboBox, QSpinBox, QDoubleSpinBox,
     QButtonGroup, QProgressBar, QStatusBar,
     QMessageBox, QCheckBox, QScrollArea, QFrame
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QLocale, QTimer
-from PyQt6.QtGui import QFont, QColor, QPalette, QLinearGradient, QPainter, QBrush, QPen
+from PyQt6.QtCore import (Qt, QThread, pyqtSignal, pyqtSlot, QLocale, QTimer, QRectF,
+                          QObject, QRunnable, QThreadPool, QSignalBlocker)
+from PyQt6.QtGui import (QFont, QColor, QPalette, QLinearGradient, QGradient, QPainter,
+                         QBrush, QPen, QPixmap, QStandardItemModel, QStandardItem)
+
+PYVISA_AVAILABLE = importlib.util.find_spec("pyvisa") is not None
+pyvisa = None
+
+# One ResourceManager for the whole panel, opened on first use (from any thread)
+_RM = None
+_RM_LOCK = threading.Lock()
+
+
+def _get_rm():
+    """Import pyvisa and open the shared ResourceManager on first use"""
+    global pyvisa, _RM
+    with _RM_LOCK:
+        if _RM is None:
+            if pyvisa is None:
+                import pyvisa as pyvisa_module
+                pyvisa = pyvisa_module
+            _RM = pyvisa.ResourceManager()
+        return _RM
+
+
+def _close_rm():
+    """Close the shared ResourceManager, if it was ever opened"""
+    global _RM
+    with _RM_LOCK:
+        if _RM is not None:
+            try:
+                _RM.close()
+            finally:
+                _RM = None
+
+
+# Mains frequency used to convert NPLC into seconds per reading
+LINE_FREQ_HZ = 50
+
+# Target acquisition time covered by one binary block read of a burst
+BURST_BLOCK_SECONDS = 0.5
+
+# Longest interval the 3458A TIMER accepts; longer intervals stay host-paced
+TIMER_MAX_SECONDS = 6000
+
+# Integration time RESET leaves in place; Integration mode never changes it
+RESET_NPLC = 10
+
+# Headroom a TIMER interval needs over the estimated reading time
+TIMER_HEADROOM = 1.1
+
+# Upper bound for RESET to finish before the setup query gives up
+RESET_TIMEOUT_MS = 5000
+
+# VFD / progress repaint interval while measuring (~30 Hz)
+DISPLAY_REFRESH_MS = 33
 
-try:
-    import pyvisa
-    PYVISA_AVAILABLE = True
-except ImportError:
-    PYVISA_AVAILABLE = False
+# Engineering prefixes per base unit, largest first:
+# (lowest |value|, factor, display unit, CSV unit); other units are shown as-is
+_UNIT_STEPS = {
+    "V": [(1.0, 1, "V", "V"), (0.0, 1e3, "mV", "mV")],
+    "Ω": [(1e9, 1e-9, "GΩ", "Gohm"), (1e6, 1e-6, "MΩ", "Mohm"),
+          (1e3, 1e-3, "kΩ", "kohm"), (0.0, 1, "Ω", "ohm")],
+}
 
+# Number formatting for the spin boxes: '.' decimal point whatever the OS locale
+_EN_US = QLocale(QLocale.Language.English, QLocale.Country.UnitedStates)
 
+# Shared fonts, created by _init_fonts() once a QApplication exists
+_FONT_SECTION = None
+_FONT_SETTING = None
+_FONT_ACTION = None
+
+
+def _init_fonts():
+    """Create the shared fonts on first use"""
+    global _FONT_SECTION, _FONT_SETTING, _FONT_ACTION
+    if _FONT_SECTION is None:
+        _FONT_SECTION = QFont("Arial", 8, QFont.Weight.Bold)
+        _FONT_SETTING = QFont("Courier New", 9)
+        _FONT_ACTION = QFont("Courier New", 12, QFont.Weight.Bold)
+
+
+
+
+# VFD-look rules for the settings panel combos, spin boxes and checkboxes
+_COMBO_QSS = """
+    QComboBox[vfd="true"] { background:#0a0a0a; color:#00cc66; border:1px solid #334;
+        border-radius:4px; padding:4px 8px;
+        font-family:'Courier New'; font-size:11px; }
+    QComboBox[vfd="true"]::drop-down { border:none; width:16px; }
+    QComboBox[vfd="true"]::down-arrow { border-left:4px solid transparent;
+        border-right:4px solid transparent; border-top:5px solid #00cc66; }
+    QComboBox[vfd="true"] QAbstractItemView { background:#111; color:#0d0; }
+    QComboBox[vfd="true"]:disabled { color:#334; border-color:#222; }
+"""
+_SPIN_QSS = """
+    QSpinBox[vfd="true"], QDoubleSpinBox[vfd="true"] { background:#0a0a0a; color:#00cc66;
+        border:1px solid #334; border-radius:4px; padding:4px 6px;
+        font-family:'Courier New'; font-size:11px; }
+    QSpinBox[vfd="true"]::up-button, QDoubleSpinBox[vfd="true"]::up-button { background:#111; width:16px; border:none; }
+    QSpinBox[vfd="true"]::down-button, QDoubleSpinBox[vfd="true"]::down-button { background:#111; width:16px; border:none; }
+    QSpinBox[vfd="true"]::up-arrow, QDoubleSpinBox[vfd="true"]::up-arrow {
+        border-left:4px solid transparent; border-right:4px solid transparent;
+        border-bottom:5px solid #00cc66; }
+    QSpinBox[vfd="true"]::down-arrow, QDoubleSpinBox[vfd="true"]::down-arrow {
+        border-left:4px solid transparent; border-right:4px solid transparent;
+        border-top:5px solid #00cc66; }
+    QSpinBox[vfd="true"]:disabled, QDoubleSpinBox[vfd="true"]:disabled { color:#334; border-color:#222; }
+"""
+_CHECK_QSS = """
+    QCheckBox[vfd="true"] { color:#889; font-family:'Courier New'; font-size:10px;
+        spacing:6px; background:transparent; }
+    QCheckBox[vfd="true"]::indicator { width:14px; height:14px; border:1px solid #445;
+        border-radius:3px; background:#050505; }
+    QCheckBox[vfd="true"]::indicator:checked { background:#00aa44; border-color:#00ff88; }
+    QCheckBox[vfd="true"]::indicator:hover { border-color:#00ff88; }
+"""
 
 
 # ─────────────────────────────────────────────────────────────
-#  Background measurement thread  (identical logic to original)
+#  Background measurement thread
 # ─────────────────────────────────────────────────────────────
 class MeasurementThread(QThread):
-    measurement_ready = pyqtSignal(float, int, str)
-    measurement_complete = pyqtSignal(list)
+    measurement_ready = pyqtSignal()  # newest reading waits in take_latest()
+    measurement_complete = pyqtSignal(object)  # values (NumPy array)
     error_occurred = pyqtSignal(str)
 
+    # Fixed command messages, encoded once with PyVISA's default "\r\n" write termination
+    _CMDS = {
+        "hold_auto": b"TARM HOLD;TRIG AUTO\r\n",
+        "reset": b"RESET\r\n",
+        "free_run": b"NRDGS 1;TRIG AUTO;TARM AUTO\r\n",
+        "tarm_hold": b"TARM HOLD\r\n",
+    }
+
     def __init__(self, resource_name, num_measurements, measurement_type,
                  gate_time, auto_zero, range_val="AUTO", mode="Integration",
                  nplc=None, digits=8, offset_comp=False,
@@ -61,105 +183,253 @@ class MeasurementThread(QThread):
         self.setacv = setacv
         self.sniffing = sniffing
         self.is_running = True
-        self.measurements = []
+        # Preallocated reading array; the first _count entries are filled
+        self.values = np.empty(num_measurements, dtype=np.float64)
+        self._count = 0
+        # Newest (value, index); at most one measurement_ready is queued at a time
+        self._latest = deque(maxlen=1)
+        self._signal_pending = False
 
     def run(self):
         try:
-            rm = pyvisa.ResourceManager()
+            rm = _get_rm()
             instrument = rm.open_resource(self.resource_name)
+
+            # Commands run in order, so the ID? reply only comes back once RESET is done
+            instrument.timeout = RESET_TIMEOUT_MS
+            instrument.write_raw(self._CMDS["hold_auto"])
+            instrument.write_raw(self._CMDS["reset"])
+            instrument.query("END ALWAYS;ID?")
+
             if self.mode == "NPLC":
                 instrument.timeout = 30000 + int(self.nplc * 100)
             else:
                 instrument.timeout = 30000 + int(self.gate_time * 1000)
 
-            instrument.write("TARM HOLD")
-            instrument.write("TRIG AUTO")
-            time.sleep(0.5)
-            instrument.write("RESET")
-            time.sleep(1.5)
-            instrument.write("END ALWAYS")
-
+            # The 3458A runs ';'-separated commands in order, so the whole setup is one bus message
             func_map = {"DCV": "DCV", "ACV": "ACV", "DCI": "DCI",
                         "ACI": "ACI", "OHMS": "OHM", "OHMF": "OHMF", "FREQ": "FREQ"}
-            instrument.write(func_map.get(self.measurement_type, "DCV"))
-            time.sleep(0.1)
-
-            if self.range_val == "AUTO":
-                instrument.write("ARANGE ON")
-            else:
-                instrument.write(f"RANGE {self.range_val}")
-
-            instrument.write(f"AZERO {1 if self.auto_zero else 0}")
-            instrument.write(f"NDIG {int(self.digits)}")
-            instrument.write(f"OCOMP {1 if self.offset_comp else 0}")
+            # RESET presets TARM AUTO; hold the meter so no reading is taken while it is set up
+            config = [
+                "TARM HOLD",
+                func_map.get(self.measurement_type, "DCV"),
+                "ARANGE ON" if self.range_val == "AUTO" else f"RANGE {self.range_val}",
+                f"AZERO {1 if self.auto_zero else 0}",
+                f"NDIG {int(self.digits)}",
+                f"OCOMP {1 if self.offset_comp else 0}",
+            ]
             if self.acband_enabled:
-                instrument.write(f"ACBAND {self.acband_value}")
-            instrument.write(f"LFILTER {1 if self.lfilter else 0}")
-            if self.setacv == "sync":
-                instrument.write("SETACV SYNC")
-            else:
-                instrument.write("SETACV ACAL")
-
+                config.append(f"ACBAND {self.acband_value}")
+            config.append(f"LFILTER {1 if self.lfilter else 0}")
+            config.append("SETACV SYNC" if self.setacv == "sync" else "SETACV ACAL")
             if self.mode == "NPLC":
-                instrument.write(f"NPLC {self.nplc}")
-                instrument.write("NRDGS 1")
-                instrument.write("TRIG AUTO")
-                instrument.write("TARM AUTO")
-                time.sleep(0.5)
-                for i in range(self.num_measurements):
-                    if not self.is_running:
-                        break
-                    if self.sniffing > 0:
-                        time.sleep(self.sniffing)
-                    try:
-                        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        value_str = instrument.read()
-                        try:
-                            value = float(value_str.strip().split(',')[0])
-                        except ValueError:
-                            value = float(value_str.strip())
-                        self.measurement_ready.emit(value, i + 1, timestamp)
-                        self.measurements.append((value, timestamp))
-                    except Exception as e:
-                        self.error_occurred.emit(str(e))
-                        break
+                config.append(f"NPLC {self.nplc}")
+
+            # Binary readings: no ASCII to parse and fewer bytes on the bus
+            oformat, datatype = self._reading_format()
+            config.append(f"MFORMAT {oformat}")
+            config.append(f"OFORMAT {oformat}")
+            instrument.write(";".join(config))
+            reading = struct.Struct(f">{datatype}")  # 3458A sends big-endian IEEE
+
+            if self.mode == "NPLC" and self.sniffing <= 0:
+                self._run_burst(instrument)
+            elif self.mode == "NPLC":
+                instrument.write_raw(self._CMDS["free_run"])
+                self._read_each(instrument, reading, delay=self.sniffing)
+            elif self._timer_paced():
+                # The meter's TIMER paces the readings; the host only drains the FIFO
+                instrument.write(f"MEM FIFO;TIMER {self.gate_time};"
+                                 f"NRDGS {self.num_measurements},TIMER;TRIG AUTO;TARM SGL")
+                self._read_each(instrument, reading, clear_on_stop=True)
             else:
-                instrument.write("NRDGS 1")
-                instrument.write("TRIG AUTO")
-                instrument.write("TARM AUTO")
-                time.sleep(0.5)
-                for i in range(self.num_measurements):
-                    if not self.is_running:
-                        break
-                    time.sleep(self.gate_time)
-                    try:
-                        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        value_str = instrument.read()
-                        try:
-                            value = float(value_str.strip().split(',')[0])
-                        except ValueError:
-                            value = float(value_str.strip())
-                        self.measurement_ready.emit(value, i + 1, timestamp)
-                        self.measurements.append((value, timestamp))
-                    except Exception as e:
-                        self.error_occurred.emit(str(e))
-                        break
-
-            instrument.write("TARM HOLD")
+                instrument.write_raw(self._CMDS["free_run"])
+                self._read_each(instrument, reading, delay=self.gate_time)
+
+            instrument.write_raw(self._CMDS["tarm_hold"])
             instrument.close()
-            self.measurement_complete.emit(self.measurements)
+            self.measurement_complete.emit(self.readings())
         except Exception as e:
             self.error_occurred.emit(str(e))
 
+    def _timer_paced(self):
+        """True if the meter's TIMER can pace readings one gate_time apart"""
+        # Only NPLC sets the reading time of the DC functions; others stay host-paced
+        if self.measurement_type not in ("DCV", "DCI", "OHMS", "OHMF"):
+            return False
+        # An interval shorter than one reading is a trigger-too-fast error on the meter
+        reading = RESET_NPLC / LINE_FREQ_HZ
+        if self.auto_zero:
+            reading *= 2
+        if self.offset_comp and self.measurement_type in ("OHMS", "OHMF"):
+            reading *= 2
+        return reading * TIMER_HEADROOM <= self.gate_time <= TIMER_MAX_SECONDS
+
+    def _reading_format(self):
+        """Return the (3458A format, struct datatype) that keeps NDIG digits"""
+        # SREAL holds ~7 significant digits, so higher NDIG settings need DREAL
+        return ("SREAL", 'f') if self.digits <= 6 else ("DREAL", 'd')
+
+    def _read_each(self, instrument, reading, delay=0, clear_on_stop=False):
+        """Read and publish one binary reading at a time, sleeping `delay` s before each"""
+        # Bound once: everything below runs per reading
+        unpack, size = reading.unpack, reading.size
+        read_bytes = instrument.read_bytes
+        publish = self._publish
+        for i in range(self.num_measurements):
+            if not self.is_running:
+                if clear_on_stop:
+                    instrument.clear()
+                break
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                publish(unpack(read_bytes(size))[0], i + 1)
+            except Exception as e:
+                self.error_occurred.emit(str(e))
+                break
+
+    def _run_burst(self, instrument):
+        """Take all readings as one NRDGS burst and drain the reading memory in binary blocks"""
+        datatype = self._reading_format()[1]
+        size = struct.calcsize(datatype)
+        # END ON: EOI only after the last reading, not after each one as END ALWAYS does,
+        # so a block of readings comes over in a single read
+        instrument.write(f"END ON;MEM FIFO;NRDGS {self.num_measurements},AUTO;TARM SGL")
+
+        block = max(1, int(BURST_BLOCK_SECONDS * LINE_FREQ_HZ / self.nplc))
+        while self._count < self.num_measurements and self.is_running:
+            points = min(block, self.num_measurements - self._count)
+            try:
+                values = instrument.read_binary_values(
+                    datatype=datatype, is_big_endian=True, header_fmt='empty',
+                    data_points=points, chunk_size=points * size,
+                    expect_termination=False)
+            except Exception as e:
+                self.error_occurred.emit(str(e))
+                break
+            self._publish_block(values)
+
+        if self._count < self.num_measurements:
+            # Abort the rest of the burst so TARM HOLD is accepted straight away
+            instrument.clear()
+
+    def _publish(self, value, num):
+        """Keep every reading, but only signal the GUI when it has caught up"""
+        self.values[num - 1] = value
+        self._count = num
+        self._notify(value, num)
+
+    def _publish_block(self, values):
+        """Store a block of readings in one go; the GUI only hears about the last one"""
+        if not values:
+            return
+        start, end = self._count, self._count + len(values)
+        self.values[start:end] = values
+        self._count = end
+        self._notify(values[-1], self._count)
+
+    def _notify(self, value, num):
+        self._latest.append((value, num))
+        if not self._signal_pending:
+            self._signal_pending = True
+            self.measurement_ready.emit()
+
+    def readings(self):
+        """Return a view of the readings taken so far"""
+        return self.values[:self._count]
+
+    def take_latest(self):
+        """Return the newest (value, index) and re-arm measurement_ready"""
+        self._signal_pending = False
+        return self._latest[-1]
+
     def stop(self):
         self.is_running = False
 
 
 
 
+# ─────────────────────────────────────────────────────────────
+#  Start-up dependency check (runs on the global thread pool)
+# ─────────────────────────────────────────────────────────────
+class DependencyCheckSignals(QObject):
+    """Signals used by DependencyCheck to report back to the GUI thread"""
+    finished = pyqtSignal(bool, str)  # ok, message
+
+
+class DependencyCheck(QRunnable):
+    """Checks for PyVISA and loads the VISA library without blocking window start-up"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = DependencyCheckSignals()
+        # Lifetime is managed from Python (the GUI keeps a reference until finished is handled)
+        self.setAutoDelete(False)
+
+    def run(self):
+        if not PYVISA_AVAILABLE:
+            self.signals.finished.emit(False, "PyVISA not installed  →  pip install pyvisa pyvisa-py")
+            return
+        try:
+            _get_rm()
+        except Exception as e:
+            self.signals.finished.emit(False, f"VISA library could not be loaded: {e}")
+        else:
+            self.signals.finished.emit(True, "")
+
+
 # ─────────────────────────────────────────────────────────────
 #  Custom 3D-style instrument button
 # ─────────────────────────────────────────────────────────────
+def _instrument_button_css(s):
+    """Build the InstrumentButton stylesheet for one colour scheme.
+    Both states live in the sheet; the "state" property selects one."""
+    return f"""
+        QPushButton {{
+            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                stop:0 {s['top']}, stop:0.4 {s['bg']}, stop:1 #111111);
+            color: {s['text']};
+            border: 1px solid #111;
+            border-radius: 5px;
+            border-top: 2px solid #ffffff44;
+            border-bottom: 4px solid #000;
+            font-family: 'Segoe UI';
+            font-size: 11px;
+            font-weight: bold;
+            padding: 6px 10px;
+            min-height: 32px;
+        }}
+        QPushButton[state="active"] {{
+            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                stop:0 {s['active_top']}, stop:0.4 {s['active_bg']}, stop:1 #111111);
+            color: {s['active_text']};
+            border-top: 1px solid #ffffff33;
+            border-bottom: 2px solid #000;
+        }}
+        QPushButton:hover {{
+            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                stop:0 #ffffff22, stop:1 #00000000);
+            border-color: #888;
+        }}
+        QPushButton:pressed {{
+            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                stop:0 #000000, stop:1 {s['bg']});
+            border-bottom: 1px solid #000;
+            border-top: 3px solid #000;
+        }}
+        QPushButton[state="active"]:pressed {{
+            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                stop:0 #000000, stop:1 {s['active_bg']});
+        }}
+        QPushButton:disabled {{
+            background: #1a1a1a;
+            color: #444;
+            border: 1px solid #222;
+        }}
+    """
+
+
 class InstrumentButton(QPushButton):
     """A button styled to look like a physical instrument button with 3D effect."""
 
@@ -180,58 +450,28 @@ class InstrumentButton(QPushButton):
                   'active_bg': '#404040', 'active_top': '#606060', 'active_text': '#cccccc'},
     }
 
+    # One stylesheet per style key, built once; set once per button
+    _STYLESHEETS = {key: _instrument_button_css(s) for key, s in STYLES.items()}
+
     def __init__(self, text, style='func', checkable=False, parent=None):
         super().__init__(text, parent)
         self._style_key = style
         self._is_active = False
         self.setCheckable(checkable)
-        self._apply_style(False)
+        self.setProperty("state", "inactive")
+        self.setStyleSheet(self._STYLESHEETS.get(style, self._STYLESHEETS['func']))
         if checkable:
             self.toggled.connect(self._apply_style)
 
     def _apply_style(self, active):
         self._is_active = active
-        s = self.STYLES.get(self._style_key, self.STYLES['func'])
-        if active:
-            bg, top, text = s['active_bg'], s['active_top'], s['active_text']
-            border_bottom = "border-bottom: 2px solid #000;"
-            border_top = "border-top: 1px solid #ffffff33;"
-        else:
-            bg, top, text = s['bg'], s['top'], s['text']
-            border_bottom = "border-bottom: 4px solid #000;"
-            border_top = "border-top: 2px solid #ffffff44;"
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                    stop:0 {top}, stop:0.4 {bg}, stop:1 #111111);
-                color: {text};
-                border: 1px solid #111;
-                border-radius: 5px;
-                {border_top}
-                {border_bottom}
-                font-family: 'Segoe UI';
-                font-size: 11px;
-                font-weight: bold;
-                padding: 6px 10px;
-                min-height: 32px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                    stop:0 #ffffff22, stop:1 #00000000);
-                border-color: #888;
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                    stop:0 #000000, stop:1 {bg});
-                border-bottom: 1px solid #000;
-                border-top: 3px solid #000;
-            }}
-            QPushButton:disabled {{
-                background: #1a1a1a;
-                color: #444;
-                border: 1px solid #222;
-            }}
-        """)
+        state = "active" if active else "inactive"
+        if self.property("state") == state:
+            return
+        self.setProperty("state", state)
+        # Re-polish so the [state=...] rules are matched again; the sheet itself is not re-parsed
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def set_active(self, active):
         if self.isCheckable():
@@ -243,7 +483,9 @@ class InstrumentButton(QPushButton):
 # ─────────────────────────────────────────────────────────────
 #  LED Indicator widget
 # ─────────────────────────────────────────────────────────────
-class LEDIndicator(QLabel):
+class LEDIndicator(QWidget):
+    """Round status LED; a plain QWidget, so no label/frame machinery or QFrame rules apply"""
+
     def __init__(self, color_on='#00ff44', color_off='#003311', size=12, parent=None):
         super().__init__(parent)
         self._color_on = color_on
@@ -251,27 +493,145 @@ class LEDIndicator(QLabel):
         self._size = size
         self._on = False
         self.setFixedSize(size, size)
-        self._update_style()
-
-    def _update_style(self):
-        color = self._color_on if self._on else self._color_off
-        glow = f"0 0 4px {self._color_on}" if self._on else "none"
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color};
-                border-radius: {self._size // 2}px;
-                border: 1px solid #001100;
-            }}
-        """)
+        # Painted directly: toggling only repaints, no stylesheet to re-parse
+        self._brush_on = QBrush(QColor(color_on))
+        self._brush_off = QBrush(QColor(color_off))
+        self._pen = QPen(QColor("#001100"))
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setBrush(self._brush_on if self._on else self._brush_off)
+        p.setPen(self._pen)
+        p.drawEllipse(0, 0, self._size - 1, self._size - 1)
+        p.end()
 
     def set_on(self, on):
+        if on == self._on:
+            return
         self._on = on
-        self._update_style()
+        self.update()
 
     def is_on(self):
         return self._on
 
 
+# ─────────────────────────────────────────────────────────────
+#  Frame with a pre-rendered gradient background
+# ─────────────────────────────────────────────────────────────
+class GradientFrame(QFrame):
+    """QFrame that renders its gradient once per size and blits it on every repaint.
+    Borders still come from the stylesheet, which should set background: transparent."""
+
+    def __init__(self, stops, diagonal=False, radius=0, parent=None):
+        super().__init__(parent)
+        self._stops = stops          # [(position, colour), ...] as in qlineargradient
+        self._diagonal = diagonal    # top-left → bottom-right instead of top → bottom
+        self._radius = radius
+        self._pix = None
+
+    def resizeEvent(self, event):
+        self._pix = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if self._pix is None:
+            self._pix = self._render()
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._pix)
+        p.end()
+        super().paintEvent(event)
+
+    def _render(self):
+        dpr = self.devicePixelRatioF()
+        pix = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        grad = QLinearGradient(0, 0, 1 if self._diagonal else 0, 1)
+        grad.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+        for pos, color in self._stops:
+            grad.setColorAt(pos, QColor(color))
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QBrush(grad))
+        p.drawRoundedRect(QRectF(0, 0, self.width(), self.height()), self._radius, self._radius)
+        p.end()
+        return pix
+
+
+# ─────────────────────────────────────────────────────────────
+#  Front-panel key with a shared gradient face
+# ─────────────────────────────────────────────────────────────
+class PanelKey(QPushButton):
+    """QPushButton whose resting face is blitted from a pixmap shared by all keys
+    of the same colour and size. Pressed/checked faces and borders come from the
+    stylesheet, whose resting background should be transparent."""
+
+    # (face colour, width, height, device pixel ratio) → rendered face
+    _faces = {}
+
+    def __init__(self, face=None, parent=None):
+        super().__init__(parent)
+        self._face = face  # top colour of the face gradient; None paints nothing
+
+    def paintEvent(self, event):
+        if self._face is not None and not (self.isDown() or self.isChecked()):
+            dpr = self.devicePixelRatioF()
+            key = (self._face, self.width(), self.height(), dpr)
+            pix = self._faces.get(key)
+            if pix is None:
+                pix = self._faces[key] = self._render(dpr)
+            p = QPainter(self)
+            p.drawPixmap(0, 0, pix)
+            p.end()
+        super().paintEvent(event)
+
+    def _render(self, dpr):
+        pix = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        grad = QLinearGradient(0, 0, 0, self.height())
+        grad.setColorAt(0, QColor(self._face))
+        grad.setColorAt(1, QColor("#bbb"))
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QBrush(grad))
+        p.drawRoundedRect(QRectF(0, 0, self.width(), self.height()), 4, 4)
+        p.end()
+        return pix
+
+
+# ─────────────────────────────────────────────────────────────
+#  Input terminal (label above a coloured binding post)
+# ─────────────────────────────────────────────────────────────
+class TerminalWidget(QWidget):
+    # Binding post: outer diameter and its 2 px ring
+    POST = 20
+
+    def __init__(self, label, color='#d00', parent=None):
+        super().__init__(parent)
+        self._label = label
+        self._label_h = self.fontMetrics().height()
+        self.setFixedSize(40, self._label_h + self.POST + 6)
+        self._brush = QBrush(QColor(color))
+        self._ring_pen = QPen(QColor("#333"), 2)
+        self._text_pen = QPen(QColor("#222"))
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(self._text_pen)
+        p.drawText(QRectF(0, 0, self.width(), self._label_h),
+                   Qt.AlignmentFlag.AlignCenter, self._label)
+        p.setPen(self._ring_pen)
+        p.setBrush(self._brush)
+        d = self.POST - 2  # the pen straddles the outline
+        p.drawEllipse(QRectF((self.width() - d) / 2, self._label_h + 5, d, d))
+        p.end()
+
+
 # ─────────────────────────────────────────────────────────────
 #  Main 3D Instrument GUI class
 # ─────────────────────────────────────────────────────────────
@@ -299,6 +659,16 @@ class HP3458MultimeterGUI3D(QMainWindow):
 
     FUNC_NAMES = ["DCV", "ACV", "DCI", "ACI", "OHMS", "OHMF", "FREQ"]
 
+    # NUMERIC / USER keypad, row by row: (key, shift label)
+    _NUMERIC_KEYS = (
+        ("7", "f1"), ("8", "f2"), ("9", "f3"), ("E", "Menu"),
+        ("4", "f4"), ("5", "f5"), ("6", "f6"), ("Error", "-"),
+        ("1", "I"),  ("2", "J"),  ("3", "K"),  ("Clear", "Back"),
+        ("0", "O"),  (".", ","),  (",", "Sep"), ("Enter", "Ent"),
+    )
+    # Command keys with the darker face
+    _GRAY_KEYS = frozenset({"E", "Error", "Clear", "Enter"})
+
     def __init__(self):
         super().__init__()
         # Pre-initialize variables to prevent AttributeError if accessed early
@@ -308,13 +678,24 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.auto_zero_check = None
         self.offset_comp_check = None
         
-        self.all_measurements = []
+        self.all_values = np.empty(0)
         self.current_unit = "V"
         self.current_func = "DCV"
         self.measurement_mode = None
+        self._last_mode = None  # mode combo text the settings panel was last laid out for
         self._func_btns = {}
         self._func_leds = {}
         
+        # Latest (value, num) waiting to be painted; readings arrive faster than the eye can follow
+        self._pending_reading = None
+        # Per-run pieces of the readout text, fixed when a measurement starts
+        self._total_n_str = "0"
+        self._shown_unit = None
+        self._dependency_check = None
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(DISPLAY_REFRESH_MS)
+        self._ui_timer.timeout.connect(self._flush_display)
+        
         try:
             self.init_ui()
         except Exception:
@@ -329,21 +710,45 @@ class HP3458MultimeterGUI3D(QMainWindow):
     # ── UI Construction ───────────────────────────────────────
 
     # ── shared sub-panel style (cream/beige inset) ───────────
-    PANEL_STYLE = """
-        QFrame {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                stop:0 #d8d0c0, stop:0.5 #ccc4b2, stop:1 #bab0a0);
+    # The gradient is painted by GradientFrame; the QFrame#panel rule in
+    # SHARED_STYLE only draws the borders of the panel and the QFrames inside it
+    PANEL_STOPS = [(0, "#d8d0c0"), (0.5, "#ccc4b2"), (1, "#bab0a0")]
+
+    # Rules shared by the whole front panel. Widgets pick theirs through object
+    # names or dynamic properties (variant / vfd / role); a selector-less sheet
+    # on a closer ancestor would override these, so the key frames don't set one.
+    SHARED_STYLE = """
+        * { background-color: #b0a898; }
+        QFrame#panel, QFrame#panel QFrame {
+            background: transparent;
             border: 1px solid #a09080;
             border-radius: 4px;
         }
+        QLabel[role="setting"]   { color:#556; background:transparent; }
+        QLabel[role="indicator"] { font-size: 9px; color: #555; }
+        QLabel[role="count"]     { font-size: 10px; color: #555; }
+        QProgressBar { border: 1px solid #999; border-radius: 3px; background: #eee; height: 10px; }
+        QProgressBar::chunk { background: #00cc66; }
     """
 
+    # _create_btn key variants: face colour, border colour, text colour
+    KEY_VARIANTS = {
+        "beige": ("#e6e0d4", "#998877", "#222"),
+        "key":   ("#ddd",    "#998877", "#222"),
+        "blue":  ("#3366cc", "#224488", "white"),
+    }
+    # Face of the gray command keys on the numeric pad
+    GRAY_FACE = "#888"
+
     # cream body colours
     BODY_BG   = "#c8c0b0"
     BODY_MID  = "#bfb8a8"
     BODY_DARK = "#a89888"
 
     def init_ui(self):
+        _init_fonts()
+        # No repaints while the ~80 panel widgets are created and laid out
+        self.setUpdatesEnabled(False)
         self.setWindowTitle("HP 3458A  │  8.5-Digit Digital Multimeter")
         self.setMinimumSize(1300, 520)
 
@@ -373,7 +778,9 @@ class HP3458MultimeterGUI3D(QMainWindow):
         root_layout.addWidget(scroll)
 
         content = QWidget()
-        content.setStyleSheet("background-color: #b0a898;")
+        # Beige body plus every shared widget rule, parsed once for the whole panel
+        content.setStyleSheet(self.SHARED_STYLE + self._key_style()
+                              + _COMBO_QSS + _SPIN_QSS + _CHECK_QSS)
         scroll.setWidget(content)
         main = QVBoxLayout(content)
         main.setContentsMargins(12, 10, 12, 10)
@@ -387,11 +794,11 @@ class HP3458MultimeterGUI3D(QMainWindow):
         main.addWidget(self._build_top_bar())
 
         # ── Instrument body outer bezel (cream/beige) ──────────
-        bezel = QFrame()
+        bezel = GradientFrame([(0, "#d8d2c4"), (0.4, "#ccc6b8"), (1, "#b8b0a0")],
+                              diagonal=True, radius=6)
         bezel.setStyleSheet("""
             QFrame {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:1,
-                    stop:0 #d8d2c4, stop:0.4 #ccc6b8, stop:1 #b8b0a0);
+                background: transparent;
                 border: 3px solid #706050;
                 border-top: 3px solid #e0d8c8;
                 border-left: 3px solid #d0c8b8;
@@ -439,6 +846,12 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("● READY  —  HP 3458A  8.5-Digit Multimeter")
 
+        # Live readouts get a fixed size, so setText() doesn't re-run the panel layouts
+        self._pin_label_size(self.display_label, "  +10000000.00000000")
+        self._pin_label_size(self.unit_label, "GΩ  [OHMF]", "MΩ  [OHMS]", "Hz  [FREQ]", "mV  [ACV]")
+        self._pin_label_size(self.sample_count_lbl, "1000000 / 1000000")
+        self.setUpdatesEnabled(True)
+
         self.check_dependencies()
         self._on_func_selected("DCV") # Call this last to update UI state
 
@@ -520,7 +933,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
         brand_txt.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         model_txt = QLabel("3458A\nMULTIMETER")
-        model_txt.setFont(QFont("Arial", 8, QFont.Weight.Bold))
+        model_txt.setFont(_FONT_SECTION)
         model_txt.setStyleSheet("color: #ccc; background: transparent; margin-top: 4px;")
         
         brand_col.addWidget(logo)
@@ -568,7 +981,6 @@ class HP3458MultimeterGUI3D(QMainWindow):
     # ── FUNCTION / RANGE (Bottom Left) ───────────────────────
     def _build_function_row(self):
         frame = QFrame()
-        frame.setStyleSheet("background: transparent;")
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(10, 5, 5, 5)
         layout.setSpacing(5)
@@ -609,8 +1021,10 @@ class HP3458MultimeterGUI3D(QMainWindow):
         
         self._func_btns = {}
         self._func_leds = {} # Initialize empty dict to prevent AttributeError
+        # Exclusivity is handled in _on_func_selected, which only touches the two buttons that change
         self._func_btn_group = QButtonGroup(self)
-        self._func_btn_group.setExclusive(True)
+        self._func_btn_group.setExclusive(False)
+        self._func_btn_group.buttonClicked.connect(self._on_func_group_clicked)
 
         funcs = [
             ("DCV", "DCV", "Auto"),
@@ -634,7 +1048,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
             btn.setCheckable(True)
             self._func_btn_group.addButton(btn)
             self._func_btns[mode] = btn
-            btn.clicked.connect(lambda ch, m=mode: self._on_func_selected(m) if ch else None)
+            btn.setProperty("func", mode)
             grid.addWidget(btn, 0, col)
             col += 1
 
@@ -645,14 +1059,14 @@ class HP3458MultimeterGUI3D(QMainWindow):
         # Wait, the physical photo shows "Auto" button, "Range" button (with arrows?), "Hold", etc.
         # Actually "Range" implies manual ranging.
         
+        # (key, shift label, action, variant)
         controls = [
-            ("AUTO_RNG", "Auto", "Arng"),
-            ("RANGE_UP", "Range ▲", ""), # customized symbol
-            ("RANGE_DN", "Range ▼", ""),
-            ("HOLD", "Hold", ""),
-            ("TEST", "Test", ""),
-            ("RESET", "Reset", ""),
-            ("LOCAL", "Local", "")
+            ("Auto", "Auth", self._range_auto, "beige"),
+            ("▲", "Rng+", self._range_up, "beige"),       # Range Up
+            ("▼", "Rng-", self._range_down, "beige"),     # Range Down
+            ("Hold", "", None, "beige"),                  # toggle hold
+            ("Reset", "", self.clear_results, "beige"),   # partially reset
+            ("Local", "Addr", None, "blue"),              # Blue button?
         ]
         
         # The photo shows: 
@@ -664,29 +1078,11 @@ class HP3458MultimeterGUI3D(QMainWindow):
         # Let's stick to standard buttons for row 2.
         
         # Row 2 Implementation
-        btn_auto = self._create_btn("Auto", "Auth", width=50, height=35)
-        btn_auto.clicked.connect(lambda: self.range_combo.setCurrentText("Auto"))
-        grid.addWidget(btn_auto, 1, 0)
-        
-        # Range Up/Down
-        # We'll use two buttons for Range since physical might be scroll
-        btn_rup = self._create_btn("▲", "Rng+", width=50, height=35) # Range Up
-        btn_rdn = self._create_btn("▼", "Rng-", width=50, height=35) # Range Down
-        btn_rup.clicked.connect(self._range_up)
-        btn_rdn.clicked.connect(self._range_down)
-        grid.addWidget(btn_rup, 1, 1)
-        grid.addWidget(btn_rdn, 1, 2)
-        
-        btn_hold = self._create_btn("Hold", "", width=50, height=35)
-        # toggle hold
-        grid.addWidget(btn_hold, 1, 3)
-
-        btn_reset = self._create_btn("Reset", "", width=50, height=35)
-        btn_reset.clicked.connect(self.clear_results) # partially reset
-        grid.addWidget(btn_reset, 1, 4)
-
-        btn_local = self._create_btn("Local", "Addr", width=50, height=35, blue_btn=True) # Blue button?
-        grid.addWidget(btn_local, 1, 5)
+        for col, (text, shift, action, variant) in enumerate(controls):
+            btn = self._create_btn(text, shift, width=50, height=35, variant=variant)
+            if action is not None:
+                btn.clicked.connect(action)
+            grid.addWidget(btn, 1, col)
 
         layout.addLayout(grid)
         
@@ -694,18 +1090,13 @@ class HP3458MultimeterGUI3D(QMainWindow):
         # Display/Window arrows (Left/Right)
         
         nav_row = QHBoxLayout()
-        arrow_up = self._create_btn("▲", "Menu", width=40, height=25, flat=True)
-        arrow_dn = self._create_btn("▼", "Scroll", width=40, height=25, flat=True)
-        arrow_l  = self._create_btn("◄", "Disp", width=40, height=25, flat=True)
-        arrow_r  = self._create_btn("►", "Wind", width=40, height=25, flat=True)
-        
-        nav_row.addWidget(QLabel("MENU"))
-        nav_row.addWidget(arrow_up)
-        nav_row.addWidget(arrow_dn)
-        nav_row.addSpacing(10)
-        nav_row.addWidget(QLabel("DISP"))
-        nav_row.addWidget(arrow_l)
-        nav_row.addWidget(arrow_r)
+        for group, arrows in (("MENU", [("▲", "Menu"), ("▼", "Scroll")]),
+                              ("DISP", [("◄", "Disp"), ("►", "Wind")])):
+            if group == "DISP":
+                nav_row.addSpacing(10)
+            nav_row.addWidget(QLabel(group))
+            for text, shift in arrows:
+                nav_row.addWidget(self._create_btn(text, shift, width=40, height=25, variant="flat"))
         
         layout.addLayout(nav_row)
         layout.addStretch()
@@ -715,13 +1106,12 @@ class HP3458MultimeterGUI3D(QMainWindow):
     # ── MENU SECTION (Middle) ──────────────────────────────
     def _build_menu_section(self):
         frame = QFrame()
-        frame.setStyleSheet("background: transparent;")
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(5, 5, 5, 5)
         
         lbl = QLabel("MENU")
         lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl.setFont(QFont("Arial", 8, QFont.Weight.Bold))
+        lbl.setFont(_FONT_SECTION)
         layout.addWidget(lbl)
 
         grid = QGridLayout()
@@ -735,16 +1125,16 @@ class HP3458MultimeterGUI3D(QMainWindow):
         grid.addWidget(self._create_btn("Auto\nCal", "C", width=50, height=35), 0, 0)
         
         btn_nplc = self._create_btn("NPLC", "E", width=50, height=35)
-        btn_nplc.clicked.connect(lambda: self.mode_combo.setCurrentText("NPLC"))
+        btn_nplc.clicked.connect(self._select_nplc_mode)
         grid.addWidget(btn_nplc, 0, 1)
 
         # Row 1
         btn_azero = self._create_btn("Auto\nZero", "L", width=50, height=35)
-        btn_azero.clicked.connect(lambda: self.auto_zero_check.toggle())
+        btn_azero.clicked.connect(self.auto_zero_check.toggle)
         grid.addWidget(btn_azero, 1, 0)
         
         btn_ocomp = self._create_btn("Offset\nComp", "N", width=50, height=35)
-        btn_ocomp.clicked.connect(lambda: self.offset_comp_check.toggle())
+        btn_ocomp.clicked.connect(self.offset_comp_check.toggle)
         grid.addWidget(btn_ocomp, 1, 1)
 
         # Row 2
@@ -766,13 +1156,12 @@ class HP3458MultimeterGUI3D(QMainWindow):
     # ── NUMERIC / USER KEYPAD (Right) ──────────────────────
     def _build_numeric_keypad(self):
         frame = QFrame()
-        frame.setStyleSheet("background: transparent;")
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(5, 5, 5, 5)
 
         lbl = QLabel("NUMERIC / USER")
         lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl.setFont(QFont("Arial", 8, QFont.Weight.Bold))
+        lbl.setFont(_FONT_SECTION)
         layout.addWidget(lbl)
 
         grid = QGridLayout()
@@ -784,21 +1173,10 @@ class HP3458MultimeterGUI3D(QMainWindow):
         # 1, 2, 3, Clear
         # 0, ., ,, Enter
         
-        keys = [
-            ("7", "f1"), ("8", "f2"), ("9", "f3"), ("E", "Menu"),
-            ("4", "f4"), ("5", "f5"), ("6", "f6"), ("Error", "-"),
-            ("1", "I"),  ("2", "J"),  ("3", "K"),  ("Clear", "Back"),
-            ("0", "O"),  (".", ","),  (",", "Sep"), ("Enter", "Ent")
-        ]
-
         row, col = 0, 0
-        for text, blue in keys:
-            # Special coloring for Enter?
-            is_enter = (text == "Enter")
-            is_gray = text in ["E", "Error", "Clear", "Enter"]
-            
-            btn = self._create_btn(text, blue, width=40, height=35, 
-                                   bg_color="#888" if is_gray else "#ddd")
+        for text, blue in self._NUMERIC_KEYS:
+            is_gray = text in self._GRAY_KEYS
+            btn = self._create_btn(text, blue, width=40, height=35, variant="key", gray=is_gray)
             
             grid.addWidget(btn, row, col)
             col += 1
@@ -813,7 +1191,6 @@ class HP3458MultimeterGUI3D(QMainWindow):
     # ── TERMINALS SECTION (Far Right) ──────────────────────
     def _build_terminals_section(self):
         frame = QFrame()
-        frame.setStyleSheet("background: transparent;")
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(5, 15, 10, 5)
         layout.setSpacing(10)
@@ -824,42 +1201,20 @@ class HP3458MultimeterGUI3D(QMainWindow):
         # Terminals (Circles with color)
         # Hi, Lo
         
-        def terminal(label, color="#d00"):
-            v = QVBoxLayout()
-            v.setSpacing(2)
-            lbl = QLabel(label)
-            lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # The terminal circle
-            term_btn = QPushButton()
-            term_btn.setFixedSize(24, 24)
-            term_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {color};
-                    border: 2px solid #333;
-                    border-radius: 12px;
-                    margin: 2px;
-                }}
-            """)
-            v.addWidget(lbl)
-            v.addWidget(term_btn)
-            v.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            return v
-        
         # Grid of terminals
         # Top: Hi (Input), Hi (Sense)
         # Bot: Lo (Input), Lo (Sense)
         # Guard
         
         term_grid = QGridLayout()
-        term_grid.addLayout(terminal("HI", "#d00"), 0, 1) # Input
-        term_grid.addLayout(terminal("HI", "#d00"), 0, 0) # Sense
+        term_grid.addWidget(TerminalWidget("HI", "#d00"), 0, 1) # Input
+        term_grid.addWidget(TerminalWidget("HI", "#d00"), 0, 0) # Sense
         
-        term_grid.addLayout(terminal("LO", "#222"), 1, 1) # Input
-        term_grid.addLayout(terminal("LO", "#222"), 1, 0) # Sense
+        term_grid.addWidget(TerminalWidget("LO", "#222"), 1, 1) # Input
+        term_grid.addWidget(TerminalWidget("LO", "#222"), 1, 0) # Sense
         
-        term_grid.addLayout(terminal("Guard", "#d90"), 2, 0) # Guard (Orange?) No, usually white/gold
-        term_grid.addLayout(terminal("Amps", "#d00"), 2, 1) # Amps/Fuse? 3458A has specific layout
+        term_grid.addWidget(TerminalWidget("Guard", "#d90"), 2, 0) # Guard (Orange?) No, usually white/gold
+        term_grid.addWidget(TerminalWidget("Amps", "#d00"), 2, 1) # Amps/Fuse? 3458A has specific layout
         
         layout.addLayout(term_grid)
         
@@ -871,6 +1226,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
         # Front/Rear switch
         btn_fr = QPushButton("Front/Rear")
         btn_fr.setFixedSize(60, 20)
+        btn_fr.setStyleSheet("background: transparent;")
         layout.addWidget(btn_fr)
         
         layout.addStretch()
@@ -878,15 +1234,21 @@ class HP3458MultimeterGUI3D(QMainWindow):
 
 
     # ── Button Factory Helper ──────────────────────────────
-    def _create_btn(self, text, blue_text="", width=50, height=40, bg_color="#e6e0d4", blue_btn=False, flat=False):
+    def _create_btn(self, text, blue_text="", width=50, height=40, variant="beige", gray=False):
         """
         Creates a button that looks like the HP keys.
-        - bg_color: main face color (beige-gray)
+        - variant: a KEY_VARIANTS face (beige-gray), or "flat" for the arrow keys
+        - gray: use the darker GRAY_FACE (numeric-pad command keys)
         - blue_text: Shift function text (printed above or on key)
-        - blue_btn: If the key itself is the blue shift key
         """
-        btn = QPushButton()
+        # Borders and text come from the shared QPushButton[variant=...] rules
+        face = None
+        if variant in self.KEY_VARIANTS:
+            face = self.GRAY_FACE if gray else self.KEY_VARIANTS[variant][0]
+
+        btn = PanelKey(face)
         btn.setFixedSize(width, height)
+        btn.setProperty("variant", variant)
         
         # Text layout logic
         # If blue_text is present, we might want to use a complex stylesheet or just multiline
@@ -900,63 +1262,12 @@ class HP3458MultimeterGUI3D(QMainWindow):
             btn.setToolTip(f"Shift: {blue_text}")
         
         btn.setText(label)
-        
-        if blue_btn:
-             # Blue shift button
-             base = "#3366cc"
-             border = "#224488"
-             txt_col = "white"
-        elif flat:
-             # Arrow keys etc
-             base = "#d0c8b8"
-             border = "none"
-             txt_col = "#333"
-        else:
-             # Standard beige key
-             base = bg_color
-             border = "#998877" # darker beige border
-             txt_col = "#222"
-
-        if flat:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {base};
-                    border: 1px solid {border};
-                    border-radius: 4px;
-                    color: {txt_col};
-                    font-weight: bold;
-                }}
-                QPushButton:pressed {{ background: #999; }}
-            """)
-        else:
-             btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {base}, stop:1 #bbb);
-                    border: 1px solid {border};
-                    border-bottom: 2px solid {border};
-                    border-radius: 4px;
-                    color: {txt_col};
-                    font-family: 'Segoe UI';
-                    font-size: 10px;
-                    font-weight: bold;
-                }}
-                QPushButton:pressed {{
-                    background: #999;
-                    border-top: 2px solid {border};
-                    border-bottom: 1px solid {border};
-                }}
-                QPushButton:checked {{
-                    background: #ddd;
-                    border: 1px inset #555;
-                }}
-            """)
         return btn
 
     # ── SETTINGS PANEL ───────────────────────────────────────
     def _build_settings_panel(self):
-        frame = QFrame()
-        frame.setStyleSheet(self.PANEL_STYLE)
+        frame = GradientFrame(self.PANEL_STOPS, radius=4)
+        frame.setObjectName("panel")
         grid = QGridLayout(frame)
         grid.setContentsMargins(12, 10, 12, 10)
         grid.setHorizontalSpacing(14)
@@ -981,7 +1292,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
         for name, color in indicators:
             led = LEDIndicator(color_on=color, color_off="#333", size=8)
             lbl_ind = QLabel(name)
-            lbl_ind.setStyleSheet("font-size: 9px; color: #555;")
+            lbl_ind.setProperty("role", "indicator")
             led_layout.addWidget(led)
             led_layout.addWidget(lbl_ind)
             led_layout.addSpacing(5)
@@ -994,13 +1305,9 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.progress_bar.setFixedWidth(100)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { border: 1px solid #999; border-radius: 3px; background: #eee; height: 10px; }
-            QProgressBar::chunk { background: #00cc66; }
-        """)
         
         self.sample_count_lbl = QLabel("0 / 0")
-        self.sample_count_lbl.setStyleSheet("font-size: 10px; color: #555;")
+        self.sample_count_lbl.setProperty("role", "count")
         
         status_row.addLayout(led_layout)
         status_row.addWidget(self.progress_bar)
@@ -1010,15 +1317,15 @@ class HP3458MultimeterGUI3D(QMainWindow):
 
         def lbl(text):
             l = QLabel(text)
-            l.setFont(QFont("Courier New", 9))
-            l.setStyleSheet("color:#556; background:transparent;")
+            l.setFont(_FONT_SETTING)
+            l.setProperty("role", "setting")
             return l
 
         # Row 0: Mode, NPLC, Interval, # Measurements
         grid.addWidget(lbl("SAMPLING MODE"), 0, 0)
         self.mode_combo = QComboBox()
         self.mode_combo.addItems(["-- Select Mode --", "Integration", "NPLC"])
-        self.mode_combo.setStyleSheet(self._combo_style())
+        self.mode_combo.setProperty("vfd", True)
         self.mode_combo.setFixedWidth(140)
         self.mode_combo.currentTextChanged.connect(self._on_mode_changed)
         grid.addWidget(self.mode_combo, 0, 1)
@@ -1027,8 +1334,13 @@ class HP3458MultimeterGUI3D(QMainWindow):
         grid.addWidget(lbl("RANGE"), 0, 8)
         self.range_combo = QComboBox()
         self.range_combo.setMinimumWidth(80)
-        self.range_combo.setStyleSheet(self._combo_style())
+        self.range_combo.setProperty("vfd", True)
         grid.addWidget(self.range_combo, 0, 9)
+        # One model per function, built once; switching function just swaps the model.
+        # Parented to the window because QComboBox deletes replaced models it owns.
+        self._range_models = {func: self._build_range_model(rows)
+                              for func, rows in self.RANGE_MAP.items()}
+        self._default_range_model = self._build_range_model([("Auto", "V", "AUTO")])
 
         self.nplc_lbl = lbl("NPLC")
         grid.addWidget(self.nplc_lbl, 0, 2)
@@ -1038,8 +1350,8 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.nplc_spin.setValue(100)
         self.nplc_spin.setDecimals(2)
         self.nplc_spin.setFixedWidth(100)
-        self.nplc_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
-        self.nplc_spin.setStyleSheet(self._spinbox_style())
+        self.nplc_spin.setLocale(_EN_US)
+        self.nplc_spin.setProperty("vfd", True)
         grid.addWidget(self.nplc_spin, 0, 3)
 
         self.integ_lbl = lbl("INTERVAL")
@@ -1052,13 +1364,13 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.gate_time_spin.setValue(1.0)
         self.gate_time_spin.setDecimals(3)
         self.gate_time_spin.setFixedWidth(90)
-        self.gate_time_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
-        self.gate_time_spin.setStyleSheet(self._spinbox_style())
+        self.gate_time_spin.setLocale(_EN_US)
+        self.gate_time_spin.setProperty("vfd", True)
         integ_h.addWidget(self.gate_time_spin)
         self.time_unit_combo = QComboBox()
         self.time_unit_combo.addItems(["seconds", "minutes", "hours"])
         self.time_unit_combo.setFixedWidth(80)
-        self.time_unit_combo.setStyleSheet(self._combo_style())
+        self.time_unit_combo.setProperty("vfd", True)
         integ_h.addWidget(self.time_unit_combo)
         grid.addLayout(integ_h, 0, 5)
 
@@ -1067,8 +1379,8 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.num_measurements_spin.setRange(1, 1000000)
         self.num_measurements_spin.setValue(10)
         self.num_measurements_spin.setFixedWidth(90)
-        self.num_measurements_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
-        self.num_measurements_spin.setStyleSheet(self._spinbox_style())
+        self.num_measurements_spin.setLocale(_EN_US)
+        self.num_measurements_spin.setProperty("vfd", True)
         grid.addWidget(self.num_measurements_spin, 0, 7)
 
         # Row 1: Checkboxes section
@@ -1076,24 +1388,23 @@ class HP3458MultimeterGUI3D(QMainWindow):
 
         self.auto_zero_check = QCheckBox("AUTO ZERO")
         self.auto_zero_check.setChecked(True)
-        self.auto_zero_check.setStyleSheet(self._checkbox_style())
+        self.auto_zero_check.setProperty("vfd", True)
         grid.addWidget(self.auto_zero_check, 1, 1)
 
         self.offset_comp_check = QCheckBox("OFFSET COMP")
-        self.offset_comp_check.setStyleSheet(self._checkbox_style())
-        self.offset_comp_check.toggled.connect(lambda v: self._indicator_leds["OFFSET COMP"].set_on(v))
+        self.offset_comp_check.setProperty("vfd", True)
+        self.offset_comp_check.toggled.connect(self._on_offset_comp_toggled)
         grid.addWidget(self.offset_comp_check, 1, 2)
 
         self.lfilter_check = QCheckBox("L FILTER")
-        self.lfilter_check.setStyleSheet(self._checkbox_style())
-        self.lfilter_check.toggled.connect(lambda v: self._indicator_leds["L FILTER"].set_on(v))
+        self.lfilter_check.setProperty("vfd", True)
+        self.lfilter_check.toggled.connect(self._on_lfilter_toggled)
         grid.addWidget(self.lfilter_check, 1, 3)
 
         # ACBand
         self.acband_enable_check = QCheckBox("AC BAND →")
-        self.acband_enable_check.setStyleSheet(self._checkbox_style())
+        self.acband_enable_check.setProperty("vfd", True)
         self.acband_enable_check.toggled.connect(self._toggle_acband)
-        self.acband_enable_check.toggled.connect(lambda v: self._indicator_leds["AC BAND"].set_on(v))
         grid.addWidget(self.acband_enable_check, 1, 4)
 
         self.acband_spin = QSpinBox()
@@ -1103,8 +1414,8 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.acband_spin.setSuffix(" Hz")
         self.acband_spin.setFixedWidth(90)
         self.acband_spin.setEnabled(False)
-        self.acband_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
-        self.acband_spin.setStyleSheet(self._spinbox_style())
+        self.acband_spin.setLocale(_EN_US)
+        self.acband_spin.setProperty("vfd", True)
         grid.addWidget(self.acband_spin, 1, 5)
 
         # SetACV
@@ -1112,12 +1423,12 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.setacv_combo = QComboBox()
         self.setacv_combo.addItems(["disable", "sync"])
         self.setacv_combo.setFixedWidth(80)
-        self.setacv_combo.setStyleSheet(self._combo_style())
+        self.setacv_combo.setProperty("vfd", True)
         grid.addWidget(self.setacv_combo, 1, 7)
 
         # Row 2: Sniffing
         self.sniffing_enable_check = QCheckBox("SNIFFING DELAY →")
-        self.sniffing_enable_check.setStyleSheet(self._checkbox_style())
+        self.sniffing_enable_check.setProperty("vfd", True)
         self.sniffing_enable_check.toggled.connect(self._toggle_sniffing)
         grid.addWidget(self.sniffing_enable_check, 2, 0, 1, 2)
 
@@ -1128,15 +1439,15 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.sniffing_spin.setSpecialValueText("OFF")
         self.sniffing_spin.setFixedWidth(90)
         self.sniffing_spin.setEnabled(False)
-        self.sniffing_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
-        self.sniffing_spin.setStyleSheet(self._spinbox_style())
+        self.sniffing_spin.setLocale(_EN_US)
+        self.sniffing_spin.setProperty("vfd", True)
         grid.addWidget(self.sniffing_spin, 2, 2)
 
         self.sniffing_unit_combo = QComboBox()
         self.sniffing_unit_combo.addItems(["seconds", "minutes", "hours"])
         self.sniffing_unit_combo.setEnabled(False)
         self.sniffing_unit_combo.setFixedWidth(80)
-        self.sniffing_unit_combo.setStyleSheet(self._combo_style())
+        self.sniffing_unit_combo.setProperty("vfd", True)
         grid.addWidget(self.sniffing_unit_combo, 2, 3)
 
         # Init (call after widgets created)
@@ -1149,21 +1460,21 @@ class HP3458MultimeterGUI3D(QMainWindow):
 
     # ── ACTION BUTTONS ────────────────────────────────────────
     def _build_action_buttons(self):
-        frame = QFrame()
-        frame.setStyleSheet(self.PANEL_STYLE)
+        frame = GradientFrame(self.PANEL_STOPS, radius=4)
+        frame.setObjectName("panel")
         h = QHBoxLayout(frame)
         h.setContentsMargins(12, 8, 12, 8)
         h.setSpacing(10)
 
         self.start_btn = InstrumentButton("▶  START", 'green')
         self.start_btn.setMinimumHeight(44)
-        self.start_btn.setFont(QFont("Courier New", 12, QFont.Weight.Bold))
+        self.start_btn.setFont(_FONT_ACTION)
         self.start_btn.clicked.connect(self.start_measurement)
         h.addWidget(self.start_btn, 2)
 
         self.stop_btn = InstrumentButton("■  STOP", 'red')
         self.stop_btn.setMinimumHeight(44)
-        self.stop_btn.setFont(QFont("Courier New", 12, QFont.Weight.Bold))
+        self.stop_btn.setFont(_FONT_ACTION)
         self.stop_btn.setEnabled(False)
         self.stop_btn.clicked.connect(self.stop_measurement)
         h.addWidget(self.stop_btn, 1)
@@ -1201,47 +1512,66 @@ class HP3458MultimeterGUI3D(QMainWindow):
         return frame
 
 
-    # ── Stylesheet helpers ────────────────────────────────────
-    def _combo_style(self):
-        return """
-            QComboBox { background:#0a0a0a; color:#00cc66; border:1px solid #334;
-                border-radius:4px; padding:4px 8px;
-                font-family:'Courier New'; font-size:11px; }
-            QComboBox::drop-down { border:none; width:16px; }
-            QComboBox::down-arrow { border-left:4px solid transparent;
-                border-right:4px solid transparent; border-top:5px solid #00cc66; }
-            QComboBox QAbstractItemView { background:#111; color:#0d0; }
-            QComboBox:disabled { color:#334; border-color:#222; }
-        """
+    def _pin_label_size(self, label, *samples):
+        """Fix label to the size of its widest sample text.
+        Qt skips the parent layout invalidation for fixed-size widgets on text changes."""
+        label.ensurePolished()  # stylesheet fonts are only known once polished
+        fm = label.fontMetrics()
+        label.setFixedSize(max(fm.horizontalAdvance(t) for t in samples) + 4, fm.height() + 2)
 
-    def _spinbox_style(self):
-        return """
-            QSpinBox, QDoubleSpinBox { background:#0a0a0a; color:#00cc66;
-                border:1px solid #334; border-radius:4px; padding:4px 6px;
-                font-family:'Courier New'; font-size:11px; }
-            QSpinBox::up-button, QDoubleSpinBox::up-button { background:#111; width:16px; border:none; }
-            QSpinBox::down-button, QDoubleSpinBox::down-button { background:#111; width:16px; border:none; }
-            QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
-                border-left:4px solid transparent; border-right:4px solid transparent;
-                border-bottom:5px solid #00cc66; }
-            QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
-                border-left:4px solid transparent; border-right:4px solid transparent;
-                border-top:5px solid #00cc66; }
-            QSpinBox:disabled, QDoubleSpinBox:disabled { color:#334; border-color:#222; }
-        """
+    def _build_range_model(self, rows):
+        """Range combo model: display name, with the RANGE argument as user data"""
+        model = QStandardItemModel(self)
+        for name, unit, cmd in rows:
+            item = QStandardItem(name)
+            item.setData(cmd, Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+        return model
 
-    def _checkbox_style(self):
-        return """
-            QCheckBox { color:#889; font-family:'Courier New'; font-size:10px;
-                spacing:6px; background:transparent; }
-            QCheckBox::indicator { width:14px; height:14px; border:1px solid #445;
-                border-radius:3px; background:#050505; }
-            QCheckBox::indicator:checked { background:#00aa44; border-color:#00ff88; }
-            QCheckBox::indicator:hover { border-color:#00ff88; }
-        """
+    # ── Stylesheet helpers ────────────────────────────────────
+    def _key_style(self):
+        rules = []
+        # Resting faces are painted by PanelKey; only borders and text come from here
+        for variant, (_, border, txt_col) in self.KEY_VARIANTS.items():
+            sel = f'QPushButton[variant="{variant}"]'
+            rules.append(f"""
+            {sel} {{
+                background: transparent;
+                border: 1px solid {border};
+                border-bottom: 2px solid {border};
+                border-radius: 4px;
+                color: {txt_col};
+                font-family: 'Segoe UI';
+                font-size: 10px;
+                font-weight: bold;
+            }}
+            {sel}:pressed {{
+                background: #999;
+                border-top: 2px solid {border};
+                border-bottom: 1px solid {border};
+            }}
+            {sel}:checked {{
+                background: #ddd;
+                border: 1px inset #555;
+            }}
+        """)
+        rules.append("""
+            QPushButton[variant="flat"] {
+                background: #d0c8b8;
+                border: 1px solid none;
+                border-radius: 4px;
+                color: #333;
+                font-weight: bold;
+            }
+            QPushButton[variant="flat"]:pressed { background: #999; }
+        """)
+        return "".join(rules)
 
     # ── Event handlers / Logic ────────────────────────────────
 
+    def _on_func_group_clicked(self, btn):
+        self._on_func_selected(btn.property("func"))
+
     def _on_func_selected(self, key):
         self.current_func = key
         # Handle func leds if they exist
@@ -1253,23 +1583,31 @@ class HP3458MultimeterGUI3D(QMainWindow):
         if hasattr(self, '_indicator_leds') and "4W OHMS" in self._indicator_leds:
             self._indicator_leds["4W OHMS"].set_on(key == "OHMF")
             
-        if key in self._func_btns and not self._func_btns[key].isChecked():
-            self._func_btns[key].setChecked(True)
-        self.range_combo.clear()
-        for name, unit, cmd in self.RANGE_MAP.get(key, [("Auto", "V", "AUTO")]):
-            self.range_combo.addItem(name, cmd)
+        for mode, btn in self._func_btns.items():
+            if btn.isChecked() != (mode == key):
+                with QSignalBlocker(btn):
+                    btn.setChecked(mode == key)
+        self.range_combo.setModel(self._range_models.get(key, self._default_range_model))
+        self.range_combo.setCurrentIndex(0)
         unit_map = {"DCV": "V DC", "ACV": "V AC", "DCI": "A DC",
                     "ACI": "A AC", "OHMS": "Ω 2W", "OHMF": "Ω 4W", "FREQ": "Hz"}
         self.current_unit = {"DCV": "V", "ACV": "V", "DCI": "A",
                              "ACI": "A", "OHMS": "Ω", "OHMF": "Ω", "FREQ": "Hz"}.get(key, "V")
         self.unit_label.setText(unit_map.get(key, "V"))
+        self._shown_unit = None
 
     def _on_mode_changed(self, mode):
+        if mode == self._last_mode:
+            return
+        self._last_mode = mode
         self.measurement_mode = mode if mode not in ("-- Select Mode --", "") else None
         nplc_vis = (mode == "NPLC")
         integ_vis = (mode == "Integration")
         sniff_vis = (mode == "NPLC")
 
+        # One repaint of the settings panel for the whole show/hide batch
+        panel = self.nplc_lbl.parentWidget()
+        panel.setUpdatesEnabled(False)
         self.nplc_lbl.setVisible(nplc_vis)
         self.nplc_spin.setVisible(nplc_vis)
         self.nplc_spin.setEnabled(nplc_vis)
@@ -1279,15 +1617,27 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.sniffing_enable_check.setVisible(sniff_vis)
         self.sniffing_spin.setVisible(sniff_vis)
         self.sniffing_unit_combo.setVisible(sniff_vis)
+        panel.setUpdatesEnabled(True)
         self._indicator_leds["AUTO ZERO"].set_on(integ_vis or nplc_vis)
 
+    @pyqtSlot(bool)
+    def _on_offset_comp_toggled(self, checked):
+        self._indicator_leds["OFFSET COMP"].set_on(checked)
+
+    @pyqtSlot(bool)
+    def _on_lfilter_toggled(self, checked):
+        self._indicator_leds["L FILTER"].set_on(checked)
+
+    @pyqtSlot(bool)
     def _toggle_acband(self, checked):
+        self._indicator_leds["AC BAND"].set_on(checked)
         self.acband_spin.setEnabled(checked)
         if checked and self.acband_spin.value() == 0:
             self.acband_spin.setValue(10)
         elif not checked:
             self.acband_spin.setValue(0)
 
+    @pyqtSlot(bool)
     def _toggle_sniffing(self, checked):
         self.sniffing_spin.setEnabled(checked)
         self.sniffing_unit_combo.setEnabled(checked)
@@ -1296,6 +1646,12 @@ class HP3458MultimeterGUI3D(QMainWindow):
         elif not checked:
             self.sniffing_spin.setValue(0)
 
+    def _select_nplc_mode(self):
+        self.mode_combo.setCurrentText("NPLC")
+
+    def _range_auto(self):
+        self.range_combo.setCurrentText("Auto")
+
     def _range_up(self):
         idx = self.range_combo.currentIndex()
         if idx < self.range_combo.count() - 1:
@@ -1313,16 +1669,16 @@ class HP3458MultimeterGUI3D(QMainWindow):
             QMessageBox.warning(self, "Missing", "PyVISA not installed.")
             return
         try:
-            rm = pyvisa.ResourceManager()
+            rm = _get_rm()
             resources = rm.list_resources()
             self.resource_combo.clear()
             if resources:
                 self.resource_combo.addItems(resources)
                 self.status_bar.showMessage(f"● VISA: {len(resources)} resource(s) found")
             else:
-                self.resource_combo.addItem("GPIB0::22::INSTR")
                 self.status_bar.showMessage("● VISA: No resources found")
-            if "GPIB0::22::INSTR" not in [self.resource_combo.itemText(i) for i in range(self.resource_combo.count())]:
+            # The default 3458A address is always offered, once
+            if self.resource_combo.findText("GPIB0::22::INSTR") < 0:
                 self.resource_combo.addItem("GPIB0::22::INSTR")
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -1336,7 +1692,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
             QMessageBox.warning(self, "Warning", "Select a VISA resource first.")
             return
         try:
-            rm = pyvisa.ResourceManager()
+            rm = _get_rm()
             inst = rm.open_resource(resource)
             inst.timeout = 5000
             idn = inst.query("ID?")
@@ -1355,7 +1711,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
             QMessageBox.warning(self, "Mode Not Set",
                                 "Please select Sampling Mode (Integration or NPLC).")
             return
-        if not self._func_btn_group.checkedButton():
+        if not any(btn.isChecked() for btn in self._func_btns.values()):
             QMessageBox.warning(self, "No Function", "Please select a measurement function.")
             return
 
@@ -1385,11 +1741,13 @@ class HP3458MultimeterGUI3D(QMainWindow):
             gtu = self.time_unit_combo.currentText()
             gate_time_sec = gtv * (60 if gtu == "minutes" else 3600 if gtu == "hours" else 1)
 
-        self.all_measurements = []
+        self.all_values = np.empty(0)
 
         self.progress_bar.setMaximum(n)
         self.progress_bar.setValue(0)
-        self.sample_count_lbl.setText(f"0 / {n}")
+        self._total_n_str = str(n)
+        self._shown_unit = None
+        self.sample_count_lbl.setText("0 / " + self._total_n_str)
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self._indicator_leds["MEAS RDY"].set_on(False)
@@ -1403,9 +1761,13 @@ class HP3458MultimeterGUI3D(QMainWindow):
             acband_value=acband_value, lfilter=lfilter, setacv=setacv,
             sniffing=sniffing_value
         )
-        self.measurement_thread.measurement_ready.connect(self.on_measurement_ready)
-        self.measurement_thread.measurement_complete.connect(self.on_measurement_complete)
-        self.measurement_thread.error_occurred.connect(self.on_error)
+        # Always queued: the slots run on the GUI thread, in emission order
+        queued = Qt.ConnectionType.QueuedConnection
+        self.measurement_thread.measurement_ready.connect(self.on_measurement_ready, queued)
+        self.measurement_thread.measurement_complete.connect(self.on_measurement_complete, queued)
+        self.measurement_thread.error_occurred.connect(self.on_error, queued)
+        self._pending_reading = None
+        self._ui_timer.start()
         self.measurement_thread.start()
 
     def stop_measurement(self):
@@ -1415,28 +1777,55 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.stop_btn.setEnabled(False)
         self.status_bar.showMessage("● STOPPED")
 
-    def on_measurement_ready(self, value, num, timestamp):
-        self.all_measurements.append((value, timestamp))
+    def closeEvent(self, event):
+        # The worker shares the ResourceManager; only close it once the worker is gone
+        thread = self.measurement_thread
+        if thread is not None and thread.isRunning():
+            thread.stop()
+            thread.wait(RESET_TIMEOUT_MS)
+        if thread is None or not thread.isRunning():
+            _close_rm()
+        super().closeEvent(event)
+
+    @pyqtSlot()
+    def on_measurement_ready(self):
+        self._pending_reading = self.measurement_thread.take_latest()
+
+    def _flush_display(self):
+        """Paint the latest reading on the VFD and progress widgets"""
+        if self._pending_reading is None:
+            return
+        value, num = self._pending_reading
+        self._pending_reading = None
         self.progress_bar.setValue(num)
-        n = self.num_measurements_spin.value()
-        self.sample_count_lbl.setText(f"{num} / {n}")
+        self.sample_count_lbl.setText(f"{num} / {self._total_n_str}")
         scaled, unit = self._scale(value)
         self.display_label.setText(f"  {scaled:+.8f}")
-        self.unit_label.setText(f"{unit}  [{self.current_func}]")
-
-    def on_measurement_complete(self, measurements):
+        if unit != self._shown_unit:
+            self._shown_unit = unit
+            self.unit_label.setText(f"{unit}  [{self.current_func}]")
+
+    @pyqtSlot(object)
+    def on_measurement_complete(self, values):
+        self._ui_timer.stop()
+        self._flush_display()
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self._indicator_leds["MEAS RDY"].set_on(True)
-        if measurements:
-            values = [m[0] for m in measurements]
-            avg_raw = sum(values) / len(values)
+        self.all_values = values
+        if len(values):
+            avg_raw = float(values.mean())
             avg_s, unit = self._scale(avg_raw)
             self.status_bar.showMessage(f"● COMPLETE  Avg={avg_s:.6f} {unit}")
             self.display_label.setText(f"  {avg_s:+.8f}")
             self.auto_save_and_open_csv()
 
+    @pyqtSlot(str)
     def on_error(self, msg):
+        self._ui_timer.stop()
+        self._flush_display()
+        if self.measurement_thread:
+            self.all_values = self.measurement_thread.readings()
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self._indicator_leds["MEAS RDY"].set_on(False)
@@ -1450,7 +1839,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
         if not resource:
             QMessageBox.warning(self, "No Resource", "Select VISA resource first."); return
         try:
-            rm = pyvisa.ResourceManager()
+            rm = _get_rm()
             inst = rm.open_resource(resource)
             inst.timeout = 30000
             self.status_bar.showMessage("● Math NULL …")
@@ -1472,7 +1861,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
         if not resource:
             QMessageBox.warning(self, "No Resource", "Select VISA resource first."); return
         try:
-            rm = pyvisa.ResourceManager()
+            rm = _get_rm()
             inst = rm.open_resource(resource)
             inst.timeout = 30000
             self.status_bar.showMessage("● AZERO ONCE …")
@@ -1489,7 +1878,8 @@ class HP3458MultimeterGUI3D(QMainWindow):
             self.status_bar.showMessage(f"● AZERO error: {e}")
 
     def clear_results(self):
-        self.all_measurements = []
+        self.all_values = np.empty(0)
+        self._pending_reading = None
         self.progress_bar.setValue(0)
         self.sample_count_lbl.setText("0 / 0")
         self.display_label.setText("  0.00000000")
@@ -1497,11 +1887,11 @@ class HP3458MultimeterGUI3D(QMainWindow):
         self.status_bar.showMessage("● CLEARED")
 
     def auto_save_and_open_csv(self):
-        if self.all_measurements:
+        if len(self.all_values):
             self.save_and_open_csv()
 
     def save_and_open_csv(self):
-        if not self.all_measurements:
+        if not len(self.all_values):
             QMessageBox.warning(self, "No Data", "No measurements to save."); return
         try:
             script_dir = Path(__file__).parent
@@ -1509,21 +1899,22 @@ class HP3458MultimeterGUI3D(QMainWindow):
             out_dir.mkdir(parents=True, exist_ok=True)
             fname = out_dir / "latest_output.csv"
 
-            values = [m[0] for m in self.all_measurements]
-            avg_raw = sum(values) / len(values)
-            avg_s, unit = self._scale_csv(avg_raw)
+            values = self.all_values
+            avg_raw = float(values.mean())
+            avg_s, unit = self._scale(avg_raw, for_csv=True)
             sf = avg_s / avg_raw if avg_raw != 0 else 1
+            scaled = values * sf
 
             with open(fname, 'w', newline='', encoding='utf-8') as f:
                 w = csv.writer(f)
                 w.writerow(['Measurement'] + list(range(1, len(values)+1)))
-                w.writerow(['Value'] + [f'{v*sf:.8g}' for v in values] + [unit])
+                w.writerow(['Value'] + [f'{v:.8g}' for v in scaled.tolist()] + [unit])
                 now = datetime.now()
                 w.writerow(['Date', now.strftime('%Y-%m-%d')])
                 w.writerow(['Time', now.strftime('%H:%M:%S')])
                 w.writerow([])
-                mn, mx = min(values)*sf, max(values)*sf
-                std = (sum((x-avg_raw)**2 for x in values)/max(1,len(values)-1))**0.5*sf
+                mn, mx = float(scaled.min()), float(scaled.max())
+                std = float(values.std(ddof=1)) * sf if len(values) > 1 else 0.0
                 w.writerow(['Statistics','Average','Minimum','Maximum','StdDev'])
                 w.writerow(['',f'{avg_s:.8g}',f'{mn:.8g}',f'{mx:.8g}',f'{std:.8g}',unit])
                 w.writerow([])
@@ -1541,31 +1932,27 @@ class HP3458MultimeterGUI3D(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Save Error", str(e))
 
-    def _scale(self, value):
-        u = self.current_unit
-        if u == "V" and abs(value) < 1.0:
-            return value * 1000, "mV"
-        if u == "Ω":
-            if abs(value) >= 1e9: return value * 1e-9, "GΩ"
-            if abs(value) >= 1e6: return value * 1e-6, "MΩ"
-            if abs(value) >= 1e3: return value * 1e-3, "kΩ"
-        return value, u
-
-    def _scale_csv(self, value):
-        u = self.current_unit
-        if u == "V" and abs(value) < 1.0:
-            return value * 1000, "mV"
-        if u == "Ω":
-            if abs(value) >= 1e9: return value * 1e-9, "Gohm"
-            if abs(value) >= 1e6: return value * 1e-6, "Mohm"
-            if abs(value) >= 1e3: return value * 1e-3, "kohm"
-            return value, "ohm"
-        return value, u
+    def _scale(self, value, for_csv=False):
+        """Return (value in engineering units, unit); CSV units are spelled in ASCII"""
+        magnitude = abs(value)
+        for bound, factor, unit, csv_unit in _UNIT_STEPS.get(self.current_unit, ()):
+            if magnitude >= bound:
+                return value * factor, csv_unit if for_csv else unit
+        return value, self.current_unit
 
     def check_dependencies(self):
+        """Start the PyVISA check on the thread pool; the window shows without waiting"""
+        self._dependency_check = DependencyCheck()
+        self._dependency_check.signals.finished.connect(self._on_dependencies_checked)
+        QThreadPool.globalInstance().start(self._dependency_check)
+
+    def _on_dependencies_checked(self, ok, message):
+        self._dependency_check = None
+        if ok:
+            return
+        self.status_bar.showMessage(f"● {message}")
         if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "Missing Dependencies",
-                                "PyVISA not installed  →  pip install pyvisa pyvisa-py")
+            QMessageBox.warning(self, "Missing Dependencies", message)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -1573,7 +1960,7 @@ class HP3458MultimeterGUI3D(QMainWindow):
 # ─────────────────────────────────────────────────────────────
 def main():
     app = QApplication(sys.argv)
-    QLocale.setDefault(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
+    QLocale.setDefault(_EN_US)
     app.setStyle('Fusion')
 
     # Force dark palette so system-light theme doesn't bleed through
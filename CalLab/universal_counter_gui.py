@@ -3,11 +3,14 @@ Universal Counter GUI Application
 A modern PyQt6-based GUI for controlling and monitoring Universal Counter instruments
 """
 
+import os
 import sys
-import csv
-import statistics
+import importlib.util
+import threading
+from array import array
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -17,11 +20,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QLocale
 from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
 
-try:
-    import pyvisa
-    PYVISA_AVAILABLE = True
-except ImportError:
-    PYVISA_AVAILABLE = False
+# pyvisa loads the VISA library on import; only probe for it here and
+# import it on first use (see _load_pyvisa)
+PYVISA_AVAILABLE = importlib.util.find_spec("pyvisa") is not None
+pyvisa = None
 
 try:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -32,15 +34,37 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
 
+def _load_pyvisa():
+    """Import pyvisa on first use and return the module"""
+    global pyvisa
+    if pyvisa is None:
+        import pyvisa as pyvisa_module
+        pyvisa = pyvisa_module
+    return pyvisa
+
+
+# Readings arrive on every gate; the log, statistics and graph are refreshed at most this often (ms)
+UI_REFRESH_MS = 50
+
+# Write buffer for the CSV export, so a long run reaches the disk in a few large writes
+CSV_WRITE_BUFFER = 1 << 20
+
+
+def summary_stats(values):
+    """Return (average, minimum, maximum, sample std deviation) of a non-empty reading buffer"""
+    arr = np.frombuffer(values, dtype=np.float64)  # zero-copy view of the array('d')
+    std_dev = float(arr.std(ddof=1)) if arr.size > 1 else 0
+    return float(arr.mean()), float(arr.min()), float(arr.max()), std_dev
+
+
 class MeasurementThread(QThread):
     """Thread for performing measurements without blocking the UI"""
-    measurement_ready = pyqtSignal(float, int)  # value, measurement_number
-    measurement_complete = pyqtSignal(list)  # all measurements
+    measurement_complete = pyqtSignal(object)  # all measurements (array('d'))
     error_occurred = pyqtSignal(str)
-    progress_update = pyqtSignal(int)
     
-    def __init__(self, resource_name, num_measurements, gate_time, channel=1, impedance=50, coupling="DC", trig_auto=True, trig_level=0.0, sensitivity=50):
+    def __init__(self, resource_name, num_measurements, gate_time, channel=1, impedance=50, coupling="DC", trig_auto=True, trig_level=0.0, sensitivity=50, rm=None):
         super().__init__()
+        self.rm = rm  # shared ResourceManager; a private one is created if None
         self.resource_name = resource_name
         self.num_measurements = num_measurements
         self.gate_time = gate_time
@@ -50,8 +74,14 @@ class MeasurementThread(QThread):
         self.trig_auto = trig_auto  # Trigger auto ON/OFF
         self.trig_level = trig_level  # Trigger level in volts
         self.sensitivity = sensitivity  # Sensitivity/Hysteresis (0, 50, 100)
-        self.is_running = True
-        self.measurements = []
+        self._stop_event = threading.Event()  # set by stop(); also wakes the gate-time wait
+        self.measurements = array('d')
+        self.buffer = array('d')
+        self._count = 0
+        # Latest (count, mean, M2, min, max), replaced as a whole after each reading is stored
+        # in buffer. The panel polls it on its refresh timer and reads buffer[:count], so the
+        # thread never queues anything for the display and the panel can never fall behind.
+        self.running_stats = (0, 0.0, 0.0, float('inf'), float('-inf'))
     
     def run(self):
         """Execute measurements in background thread"""
@@ -60,9 +90,13 @@ class MeasurementThread(QThread):
                 self.error_occurred.emit("PyVISA is not installed. Please install it using: pip install pyvisa pyvisa-py")
                 return
             
-            rm = pyvisa.ResourceManager()
+            rm = self.rm if self.rm is not None else _load_pyvisa().ResourceManager()
             instrument = rm.open_resource(self.resource_name)
-            instrument.timeout = int(self.gate_time * 1000 + 5000)  # Gate time + 5 seconds buffer
+            instrument.timeout = int(self.gate_time * 1000 + 2000)  # Gate time + 2 seconds buffer
+            # Commands end with LF + EOI; binary blocks carry their own length, so no read scan
+            instrument.write_termination = '\n'
+            instrument.read_termination = None
+            instrument.send_end = True
             
             # Get instrument ID
             idn = instrument.query("*IDN?")
@@ -117,32 +151,142 @@ class MeasurementThread(QThread):
             except:
                 pass  # Instrument may not support these commands
             
-            self.measurements = []
+            # Return readings as 64-bit binary blocks instead of ASCII text; a
+            # unit that rejects this is caught by the READ? fallback below
+            instrument.write(":FORM REAL")
+            binary = True
+            
+            # Packed doubles, sized for the whole run up front
+            self.buffer = array('d', bytes(8 * self.num_measurements))
+            self._count = 0
+            n, mean, m2, min_val, max_val = self.running_stats
             
             for i in range(self.num_measurements):
-                if not self.is_running:
+                if self._stop_event.is_set():
                     break
                 
                 # Query measurement
-                response = instrument.query("READ?")
-                value = float(response.strip())
+                if binary:
+                    try:
+                        value = instrument.query_binary_values("READ?", datatype='d', is_big_endian=True)[0]
+                    except ValueError:
+                        # Reply is not a binary block: no REAL format on this unit/firmware,
+                        # so go back to ASCII for the rest of the run. Timeouts still end the run.
+                        binary = False
+                        instrument.clear()
+                        instrument.read_termination = '\n'
+                        instrument.write(":FORM ASC")
+                if not binary:
+                    response = instrument.query("READ?")
+                    value = float(response.strip())
+                
+                self.buffer[self._count] = value
+                self._count += 1
                 
-                self.measurements.append(value)
-                self.measurement_ready.emit(value, i + 1)
-                self.progress_update.emit(int((i + 1) / self.num_measurements * 100))
+                # Welford update: O(1) per reading
+                n += 1
+                delta = value - mean
+                mean += delta / n
+                m2 += delta * (value - mean)
+                min_val = min(min_val, value)
+                max_val = max(max_val, value)
+                self.running_stats = (n, mean, m2, min_val, max_val)
                 
-                # Wait for gate time plus small buffer
-                self.msleep(int(self.gate_time * 1000) + 100)
+                # Pace by the gate time; READ? has already waited for the reading itself.
+                # Stop interrupts the wait immediately instead of after the full gate.
+                if self._stop_event.wait(self.gate_time):
+                    break
             
             instrument.close()
+            self.measurements = self.buffer[:self._count]
             self.measurement_complete.emit(self.measurements)
             
         except Exception as e:
+            self.measurements = self.buffer[:self._count]
             self.error_occurred.emit(f"Error: {str(e)}")
     
     def stop(self):
         """Stop the measurement thread"""
-        self.is_running = False
+        self._stop_event.set()
+
+
+class CsvSaveThread(QThread):
+    """Thread that writes the CSV export so disk I/O never blocks the UI"""
+    saved = pyqtSignal(str, bool)  # final path, saved under a fallback name
+    failed = pyqtSignal(str)
+    
+    def __init__(self, output_dir, base_filename, write_content, close_file, write_csv=True, npy_values=None):
+        super().__init__()
+        self.output_dir = output_dir
+        self.base_filename = base_filename
+        self.write_content = write_content  # write_content(csvfile) writes a snapshot of the data
+        self.close_file = close_file
+        self.write_csv = write_csv
+        self.npy_values = npy_values  # readings to also save as binary .npy, or None
+        self.npy_path = None
+    
+    def _write(self, path):
+        """Write the whole file, then flush and fsync it once"""
+        # Durability is paid once here; don't add per-row flushes to write_content
+        with open(path, 'w', newline='', encoding='utf-8-sig', buffering=CSV_WRITE_BUFFER) as csvfile:
+            self.write_content(csvfile)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+    
+    def run(self):
+        """Write the file, retrying once the Excel lock is released"""
+        # Ensure directory exists
+        if not self.output_dir.exists():
+            try:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                self.failed.emit(f"Error creating folder: {str(e)}")
+                return
+        
+        # Binary copy: exact values, 8 bytes per reading, one call
+        if self.npy_values is not None:
+            npy_path = self.output_dir / f"{Path(self.base_filename).stem}.npy"
+            try:
+                np.save(npy_path, np.frombuffer(self.npy_values, dtype=np.float64))
+            except Exception as e:
+                self.failed.emit(f"Failed to save file:\n{str(e)}")
+                return
+            self.npy_path = str(npy_path)
+            if not self.write_csv:
+                self.saved.emit(self.npy_path, False)
+                return
+        
+        final_path = self.output_dir / self.base_filename
+        
+        # Try to save, if locked, try closing again, if still locked, use timestamped name
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            try:
+                # Attempt to write
+                self._write(final_path)
+                self.saved.emit(str(final_path), False)
+                return
+            except PermissionError:
+                # File is locked
+                if attempt == 0:
+                    # First failure: Try checking/closing file again aggressively
+                    self.close_file(final_path)
+                    self.msleep(500)
+                elif attempt == max_retries - 1:
+                    # Last failure: Change filename to avoid error
+                    timestamp = datetime.now().strftime('%H%M%S')
+                    final_path = self.output_dir / f"{final_path.stem}_{timestamp}.csv"
+                    try:
+                        self._write(final_path)
+                        self.saved.emit(str(final_path), True)
+                    except Exception as e:
+                        self.failed.emit(f"Failed to save file:\n{str(e)}")
+                    return
+            except Exception as e:
+                # If directory issue or other, might fail
+                self.failed.emit(f"Failed to save file:\n{str(e)}")
+                return
 
 
 class PlotCanvas(FigureCanvas):
@@ -165,7 +309,7 @@ class PlotCanvas(FigureCanvas):
         self.axes.yaxis.label.set_color('#2c3e50')
         self.axes.title.set_color('#2c3e50')
         
-        self.measurements = []
+        self.measurements = array('d')
         self.plot_data()
     
     def plot_data(self):
@@ -182,7 +326,7 @@ class PlotCanvas(FigureCanvas):
             
             # Add statistics
             if len(self.measurements) > 1:
-                avg = sum(self.measurements) / len(self.measurements)
+                avg = float(np.frombuffer(self.measurements, dtype=np.float64).mean())
                 self.axes.axhline(y=avg, color='#e74c3c', linestyle='--', linewidth=2, label=f'Average: {avg:.6f} Hz')
                 self.axes.legend(facecolor='#ffffff', edgecolor='#3c4043', labelcolor='#3c4043')
         else:
@@ -201,10 +345,15 @@ class PlotCanvas(FigureCanvas):
         """Add a new measurement and update plot"""
         self.measurements.append(value)
         self.plot_data()
+
+    def add_measurements(self, values):
+        """Add several measurements and redraw the plot once"""
+        self.measurements.extend(values)
+        self.plot_data()
     
     def clear_measurements(self):
         """Clear all measurements"""
-        self.measurements = []
+        self.measurements = array('d')
         self.plot_data()
 
 
@@ -214,9 +363,17 @@ class UniversalCounterGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.measurement_thread = None
-        self.all_measurements = []
+        self._shown_count = 0  # readings of the current run already shown in the log/graph
+        self.csv_save_thread = None
+        self._rm = None  # pyvisa ResourceManager, created on first use
+        self.all_measurements = array('d')
         self.use_arabic_numerals = False  # Toggle for Arabic numerals (False = Western numerals)
         self.init_ui()
+
+        # Coalesces per-reading updates into one refresh every UI_REFRESH_MS
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(UI_REFRESH_MS)
+        self._ui_timer.timeout.connect(self._flush_ui)
     
     def to_arabic_numerals(self, text):
         """Convert Western numerals (0-9) to Arabic-Indic numerals (٠-٩)"""
@@ -664,6 +821,15 @@ class UniversalCounterGUI(QMainWindow):
         save_btn.clicked.connect(self.save_and_open_csv)
         layout.addWidget(save_btn)
         
+        # Save format: CSV for spreadsheets, NPY for exact binary values
+        self.save_format_combo = QComboBox()
+        self.save_format_combo.addItems(["CSV", "NPY", "CSV + NPY"])
+        self.save_format_combo.setCurrentText("CSV")
+        self.save_format_combo.setFont(QFont("Segoe UI", 10))
+        self.save_format_combo.setMinimumHeight(50)
+        self.save_format_combo.setStyleSheet(self.get_input_style())
+        layout.addWidget(self.save_format_combo)
+        
         return layout
     
     def set_light_theme(self):
@@ -851,6 +1017,12 @@ class UniversalCounterGUI(QMainWindow):
             self.results_text.append("\n".join(messages))
             self.results_text.append("\n" + "="*60 + "\n")
     
+    def _get_resource_manager(self):
+        """Return the shared ResourceManager, creating it on first use"""
+        if self._rm is None:
+            self._rm = _load_pyvisa().ResourceManager()
+        return self._rm
+    
     def refresh_resources(self):
         """Refresh available VISA resources"""
         if not PYVISA_AVAILABLE:
@@ -858,8 +1030,7 @@ class UniversalCounterGUI(QMainWindow):
             return
         
         try:
-            rm = pyvisa.ResourceManager()
-            resources = rm.list_resources()
+            resources = self._get_resource_manager().list_resources()
             
             self.resource_combo.clear()
             
@@ -898,8 +1069,7 @@ class UniversalCounterGUI(QMainWindow):
             return
         
         try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
+            instrument = self._get_resource_manager().open_resource(resource_name)
             instrument.timeout = 5000
             
             # Query instrument identification
@@ -1024,7 +1194,7 @@ class UniversalCounterGUI(QMainWindow):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setValue(0)
-        self.all_measurements = []
+        self.all_measurements = array('d')
         
         # Reset Stat Labels
         self.stat_mean_lbl.setText("---")
@@ -1038,11 +1208,12 @@ class UniversalCounterGUI(QMainWindow):
             self.plot_canvas.clear_measurements()
         
         # Start measurement thread with all parameters
-        self.measurement_thread = MeasurementThread(resource_name, num_measurements, gate_time, channel, impedance, coupling, trig_auto, trig_level, sensitivity)
-        self.measurement_thread.measurement_ready.connect(self.on_measurement_ready)
+        self.measurement_thread = MeasurementThread(resource_name, num_measurements, gate_time, channel, impedance, coupling, trig_auto, trig_level, sensitivity,
+                                                     rm=self._rm)
         self.measurement_thread.measurement_complete.connect(self.on_measurement_complete)
         self.measurement_thread.error_occurred.connect(self.on_error)
-        self.measurement_thread.progress_update.connect(self.progress_bar.setValue)
+        self._shown_count = 0
+        self._ui_timer.start()
         self.measurement_thread.start()
         
         self.status_bar.showMessage("Measurement in progress...")
@@ -1070,50 +1241,51 @@ class UniversalCounterGUI(QMainWindow):
         self.status_bar.showMessage("Measurement stopped by user")
         self.results_text.append("\n⏹️ Measurement stopped by user\n")
     
-    def on_measurement_ready(self, value, measurement_num):
-        """Handle new measurement data"""
-        self.all_measurements.append(value)
-        result_text = f"Measurement #{measurement_num}: {value:.6f} Hz"
-        self.results_text.append(self.to_arabic_numerals(result_text))
-        
+    def _flush_ui(self):
+        """Show the readings the thread has stored since the last refresh"""
+        thread = self.measurement_thread
+        if thread is None:
+            return
+        # One read of the latest snapshot; everything up to its count is already in the buffer
+        count, mean, m2, min_val, max_val = thread.running_stats
+        if count == self._shown_count:
+            return
+        first = self._shown_count
+        new_values = thread.buffer[first:count]
+        self._shown_count = count
+
+        lines = [f"Measurement #{num}: {value:.6f} Hz" for num, value in enumerate(new_values, first + 1)]
+        self.results_text.append(self.to_arabic_numerals("\n".join(lines)))
+
         if MATPLOTLIB_AVAILABLE:
-            self.plot_canvas.add_measurement(value)
+            self.plot_canvas.add_measurements(new_values)
             
-        # Update Real-time Statistics
-        measurements = self.all_measurements
-        count = len(measurements)
+        # Update Real-time Statistics from the thread's running accumulators
         self.stat_count_lbl.setText(str(count))
+        self.progress_bar.setValue(int(count / thread.num_measurements * 100))
         
         if count > 0:
-            avg = sum(measurements) / count
-            self.stat_mean_lbl.setText(f"{avg:.3e}")
-            self.stat_max_lbl.setText(f"{max(measurements):.3e}")
-            self.stat_min_lbl.setText(f"{min(measurements):.3e}")
+            self.stat_mean_lbl.setText(f"{mean:.3e}")
+            self.stat_max_lbl.setText(f"{max_val:.3e}")
+            self.stat_min_lbl.setText(f"{min_val:.3e}")
             
             if count > 1:
-                try:
-                    std_dev = statistics.stdev(measurements)
-                    self.stat_std_lbl.setText(f"{std_dev:.3e}")
-                except:
-                    pass
+                # Sample (n-1) standard deviation
+                std_dev = (m2 / (count - 1)) ** 0.5
+                self.stat_std_lbl.setText(f"{std_dev:.3e}")
     
     def on_measurement_complete(self, measurements):
         """Handle measurement completion"""
+        self._ui_timer.stop()
+        self._flush_ui()
+        self.all_measurements = measurements
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.progress_bar.setValue(100)
         
-        # Calculate statistics
         # Calculate statistics
         if measurements:
-            avg = sum(measurements) / len(measurements)
-            min_val = min(measurements)
-            max_val = max(measurements)
-            
-            if len(measurements) > 1:
-                std_dev = statistics.stdev(measurements)
-            else:
-                std_dev = 0
+            avg, min_val, max_val, std_dev = summary_stats(measurements)
             
             # Update Stat Labels (Final)
             self.stat_mean_lbl.setText(f"{avg:.3e}")
@@ -1140,6 +1312,10 @@ class UniversalCounterGUI(QMainWindow):
     
     def on_error(self, error_message):
         """Handle errors from measurement thread"""
+        self._ui_timer.stop()
+        self._flush_ui()
+        if self.measurement_thread:
+            self.all_measurements = self.measurement_thread.measurements  # readings taken before the error
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
@@ -1150,7 +1326,7 @@ class UniversalCounterGUI(QMainWindow):
     def clear_results(self):
         """Clear all results"""
         self.results_text.clear()
-        self.all_measurements = []
+        self.all_measurements = array('d')
         self.progress_bar.setValue(0)
         
         if MATPLOTLIB_AVAILABLE:
@@ -1183,124 +1359,104 @@ class UniversalCounterGUI(QMainWindow):
 
     def save_and_open_csv(self):
         """Save measurements to latest_output.csv and open it automatically"""
-        if not self.all_measurements:
+        measurements = self.all_measurements
+        thread = self.measurement_thread
+        if thread is not None and thread.isRunning():
+            # all_measurements is only set when the run ends; take what the thread has stored so far
+            measurements = thread.buffer[:thread.running_stats[0]]
+        if not measurements:
             QMessageBox.warning(self, "No Data", "No measurements to save!")
             return
+        if self.csv_save_thread is not None and self.csv_save_thread.isRunning():
+            self.status_bar.showMessage("Save already in progress...")
+            return
+        
+        # Snapshot the data here; the file is written on a worker thread
+        values = array('d', measurements)
+        gate_time = self.gate_time_spin.value()
         
         # Explicitly set output directory
         output_dir = Path(r"E:\Cal-Lab\Measurement_Results")
         
-        # Ensure directory exists
-        if not output_dir.exists():
-            try:
-                output_dir.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                self.status_bar.showMessage(f"Error creating folder: {str(e)}")
-                return
-
-        # Target filename
-        base_filename = "latest_output.csv"
-        final_path = output_dir / base_filename
-        
-        # Try to save, if locked, try closing again, if still locked, use timestamped name
-        max_retries = 3
-        save_success = False
-        
-        for attempt in range(max_retries):
-            try:
-                # Attempt to write
-                with open(final_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                    self.write_csv_content(csvfile)
-                save_success = True
-                break
-            except PermissionError:
-                # File is locked
-                if attempt == 0:
-                    # First failure: Try checking/closing file again aggressively
-                    self.close_csv_file(final_path)
-                    time.sleep(0.5)
-                elif attempt == max_retries - 1:
-                    # Last failure: Change filename to avoid error
-                    timestamp = datetime.now().strftime('%H%M%S')
-                    # IMPORTANT: Use output_dir here too
-                    final_path = output_dir / f"latest_output_{timestamp}.csv"
-                    try:
-                        with open(final_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                            self.write_csv_content(csvfile)
-                        save_success = True
-                        self.status_bar.showMessage(f"File locked, saved as {final_path.name} instead")
-                    except Exception as e:
-                        QMessageBox.critical(self, "Save Error", f"Failed to save file:\n{str(e)}")
-                        return
-            except Exception as e:
-                # If directory issue or other, might fail
-                QMessageBox.critical(self, "Save Error", f"Failed to save file:\n{str(e)}")
-                return
-            except Exception as e:
-                # If directory issue or other, might fail
-                QMessageBox.critical(self, "Save Error", f"Failed to save file:\n{str(e)}")
-                return
+        save_format = self.save_format_combo.currentText()
+        self.csv_save_thread = CsvSaveThread(
+            output_dir, "latest_output.csv",
+            lambda csvfile: self.write_csv_content(csvfile, values, gate_time),
+            self.close_csv_file,
+            write_csv="CSV" in save_format,
+            npy_values=values if "NPY" in save_format else None)
+        self.csv_save_thread.saved.connect(self.on_csv_saved)
+        self.csv_save_thread.failed.connect(self.on_csv_save_failed)
+        self.csv_save_thread.start()
+        self.status_bar.showMessage("Saving measurements...")
+    
+    def on_csv_saved(self, path, renamed):
+        """Open the CSV once the worker has written it"""
+        final_path = Path(path)
+        npy_path = self.csv_save_thread.npy_path
+        if npy_path:
+            self.results_text.append(f"\n💾 Binary data saved to: {npy_path}")
+        if final_path.suffix == ".npy":
+            # NPY only: nothing to open in a spreadsheet
+            self.status_bar.showMessage(f"Saved: {final_path.name}")
+            return
+        if renamed:
+            self.status_bar.showMessage(f"File locked, saved as {final_path.name} instead")
         
-        if save_success:
-            # Open the file automatically
-            import os
-            try:
-                if sys.platform == 'win32':
-                    os.startfile(str(final_path))
-                elif sys.platform == 'darwin':
-                    os.system(f'open "{final_path}"')
-                else:
-                    os.system(f'xdg-open "{final_path}"')
-                
-                self.status_bar.showMessage(f"Saved and opened: {final_path.name}")
-                self.results_text.append(f"\n💾 Data saved to: {final_path}")
-                self.results_text.append(f"📂 File opened automatically\n")
-            except Exception as e:
-                self.status_bar.showMessage(f"Saved but failed to open: {str(e)}")
+        # Open the file automatically
+        try:
+            if sys.platform == 'win32':
+                os.startfile(str(final_path))
+            elif sys.platform == 'darwin':
+                os.system(f'open "{final_path}"')
+            else:
+                os.system(f'xdg-open "{final_path}"')
+            
+            self.status_bar.showMessage(f"Saved and opened: {final_path.name}")
+            self.results_text.append(f"\n💾 Data saved to: {final_path}")
+            self.results_text.append(f"📂 File opened automatically\n")
+        except Exception as e:
+            self.status_bar.showMessage(f"Saved but failed to open: {str(e)}")
+    
+    def on_csv_save_failed(self, message):
+        """Report a failed CSV save"""
+        self.status_bar.showMessage("Save failed")
+        QMessageBox.critical(self, "Save Error", message)
 
-    def write_csv_content(self, csvfile):
-        """Helper to write CSV content"""
-        writer = csv.writer(csvfile)
+    def write_csv_content(self, csvfile, values, gate_time):
+        """Helper to write CSV content; runs on the save thread, so it only uses its arguments"""
+        # No field needs quoting, so the rows are joined directly and written in one call
+        # (same bytes as csv.writer, including its \r\n line ends)
+        n = len(values)
         now = datetime.now()
+        padding = "," * (n - 1)
         
         # Header information commented out or simplified for certificates?
         # Let's follow the Multimeter horizontal format strictly
-        
-        # Row 1: Measurement numbers
-        measurement_numbers = ['Measurement'] + [str(i) for i in range(1, len(self.all_measurements) + 1)]
-        writer.writerow(measurement_numbers)
-        
-        # Row 2: Values
-        values = ['Value (Hz)'] + [f'{value:.6f}' for value in self.all_measurements]
-        writer.writerow(values)
-        
-        # Row 3: Date
-        date_row = ['Date', now.strftime('%Y-%m-%d')] + [''] * (len(self.all_measurements) - 1)
-        writer.writerow(date_row)
-        
-        # Row 4: Time
-        time_row = ['Time', now.strftime('%H:%M:%S')] + [''] * (len(self.all_measurements) - 1)
-        writer.writerow(time_row)
-        
-        writer.writerow([])
+        rows = [
+            # Row 1: Measurement numbers
+            "Measurement," + ",".join(map(str, range(1, n + 1))),
+            # Row 2: Values
+            "Value (Hz)," + ",".join(f'{value:.6f}' for value in values),
+            # Row 3: Date
+            f"Date,{now.strftime('%Y-%m-%d')}{padding}",
+            # Row 4: Time
+            f"Time,{now.strftime('%H:%M:%S')}{padding}",
+            "",
+        ]
         
         # Statistics
-        avg = sum(self.all_measurements) / len(self.all_measurements)
-        min_val = min(self.all_measurements)
-        max_val = max(self.all_measurements)
-        if len(self.all_measurements) > 1:
-            variance = sum((x - avg) ** 2 for x in self.all_measurements) / (len(self.all_measurements) - 1)
-            std_dev = variance ** 0.5
-        else:
-            std_dev = 0
+        avg, min_val, max_val, std_dev = summary_stats(values)
             
-        writer.writerow(['Statistics', 'Average', 'Minimum', 'Maximum', 'Std Deviation'])
-        writer.writerow(['', f'{avg:.6f}', f'{min_val:.6f}', f'{max_val:.6f}', f'{std_dev:.6f}'])
-        
-        writer.writerow([])
-        writer.writerow(['Measurement Type', 'Frequency'])
-        writer.writerow(['Total Measurements', len(self.all_measurements)])
-        writer.writerow(['Gate Time (seconds)', self.gate_time_spin.value()])
+        rows += [
+            "Statistics,Average,Minimum,Maximum,Std Deviation",
+            f",{avg:.6f},{min_val:.6f},{max_val:.6f},{std_dev:.6f}",
+            "",
+            "Measurement Type,Frequency",
+            f"Total Measurements,{n}",
+            f"Gate Time (seconds),{gate_time}",
+        ]
+        csvfile.write("\r\n".join(rows) + "\r\n")
 
     def auto_save_and_open_csv(self):
         """Automatically save and open CSV after measurement completes"""
@@ -4,6 +4,11 @@ A modern PyQt6-based GUI for controlling Keysight 33500B 30 MHz Dual-Channel Wav
 """
 
 import sys
+import math
+import time
+import importlib.util
+import functools
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 import numpy as np
@@ -14,25 +19,231 @@ from PyQt6.QtWidgets import (
     QGroupBox, QRadioButton, QButtonGroup, QStatusBar,
     QMessageBox, QCheckBox, QScrollArea, QFrame, QSizePolicy, QLayout
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QLocale, QRect, QSize, QPoint
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QLocale, QRect, QSize, QPoint, QTimer, QSignalBlocker,
+    QObject, QRunnable, QThreadPool, QMutex
+)
 from PyQt6.QtGui import QFont
-import time
+
+# matplotlib and pyvisa are slow to import; only probe for them here and
+# import them on first use (see _load_matplotlib / _load_pyvisa)
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+PYVISA_AVAILABLE = importlib.util.find_spec("pyvisa") is not None
+FigureCanvas = None
+Figure = None
+pyvisa = None
 
 try:
-    import matplotlib
-    matplotlib.use('QtAgg')
-    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-    from matplotlib.figure import Figure
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
+    import pyqtgraph as pg
+    pg.setConfigOptions(antialias=True, useOpenGL=True)
+    PYQTGRAPH_AVAILABLE = True
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    PYQTGRAPH_AVAILABLE = False
 
 try:
-    import pyvisa
-    PYVISA_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    PYVISA_AVAILABLE = False
+    NUMBA_AVAILABLE = False
+
+
+def _load_matplotlib():
+    """Import the matplotlib Qt backend on first use"""
+    global FigureCanvas, Figure
+    if Figure is None:
+        import matplotlib
+        matplotlib.use('QtAgg')
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure as MplFigure
+        FigureCanvas, Figure = FigureCanvasQTAgg, MplFigure
+
+
+def _load_pyvisa():
+    """Import pyvisa on first use and return the module"""
+    global pyvisa
+    if pyvisa is None:
+        import pyvisa as pyvisa_module
+        pyvisa = pyvisa_module
+    return pyvisa
+
+
+# Shared fonts, created by _init_fonts() once a QApplication exists
+_FONT_UI_10 = None
+_FONT_UI_10_BOLD = None
+_FONT_GROUP = None
+_FONT_CONSOLE = None
+_FONT_BUTTON = None
+_FONT_TITLE = None
+
+
+def _init_fonts():
+    """Create the shared fonts on first use"""
+    global _FONT_UI_10, _FONT_UI_10_BOLD, _FONT_GROUP, _FONT_CONSOLE, _FONT_BUTTON, _FONT_TITLE
+    if _FONT_UI_10 is None:
+        _FONT_UI_10 = QFont("Segoe UI", 10)
+        _FONT_UI_10_BOLD = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        _FONT_GROUP = QFont("Segoe UI", 11, QFont.Weight.Bold)
+        _FONT_CONSOLE = QFont("Consolas", 9)
+        _FONT_BUTTON = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        _FONT_TITLE = QFont("Segoe UI", 18, QFont.Weight.Bold)
+
+
+# Number of waveform periods shown in the preview
+PREVIEW_CYCLES = 3
+
+# Preview sample count follows the plot width (1.5x oversampled), clamped to this range
+PREVIEW_MIN_SAMPLES = 256
+PREVIEW_MAX_SAMPLES = 1024
+
+# Read chunk size for cached sessions; large enough that a config or arb
+# readback arrives in one low-level read instead of many 20 kB ones
+VISA_CHUNK_SIZE = 102400
+
+# Seconds a VISA resource scan is reused before Refresh rescans the bus
+RESOURCE_CACHE_SECONDS = 5.0
+
+# Entries kept in the instrument status panel
+STATUS_LOG_MAX_ENTRIES = 200
+
+# Milliseconds closeEvent waits for running VISA workers; one session timeout
+# plus margin, after which the last worker closes the sessions itself
+VISA_CLOSE_WAIT_MS = 6000
+
+# Shape codes for the periodic preview kernel (pulse is previewed as a square)
+SHAPE_SQUARE = 0
+SHAPE_TRIANGLE = 1
+SHAPE_RAMP = 2
+SHAPE_KINDS = {'SQU': SHAPE_SQUARE, 'PULS': SHAPE_SQUARE, 'TRI': SHAPE_TRIANGLE, 'RAMP': SHAPE_RAMP}
+
+
+def _gen_shape_loop(kind, t, amp, off, duty, out):
+    """Fill out with amp * shape(t) + off in a single pass over t"""
+    for i in range(t.size):
+        frac = t[i] - math.floor(t[i])
+        if kind == SHAPE_SQUARE:
+            v = 1.0 if frac < duty else -1.0
+        elif kind == SHAPE_TRIANGLE:
+            v = 2.0 * abs(2.0 * frac - 1.0) - 1.0
+        else:
+            v = 2.0 * frac - 1.0
+        out[i] = amp * v + off
+    return out
+
+
+def _gen_shape_numpy(kind, t, amp, off, duty, out):
+    """NumPy equivalent of _gen_shape_loop, used when numba is not installed"""
+    frac = t % 1
+    if kind == SHAPE_SQUARE:
+        out[:] = np.where(frac < duty, 1.0, -1.0)
+    elif kind == SHAPE_TRIANGLE:
+        out[:] = 2 * np.abs(2 * frac - 1) - 1
+    else:
+        out[:] = 2 * frac - 1
+    out *= amp
+    out += off
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _gen_shape = njit(cache=True, fastmath=True)(_gen_shape_loop)
+else:
+    _gen_shape = _gen_shape_numpy
+
+
+@functools.lru_cache(maxsize=8)
+def _preview_grid(n):
+    """Time axis, t % 1 and unit-amplitude shapes for an n-sample preview.
+
+    Only the sample count varies between redraws, so these are computed once
+    per n and shared by every waveform; redraws just scale and offset them.
+    """
+    t = np.linspace(0, PREVIEW_CYCLES, n, dtype=np.float32)
+    t_mod1 = (t % 1).astype(np.float32)
+    t.setflags(write=False)
+    t_mod1.setflags(write=False)
+    twopi_t = (2 * np.pi * t).astype(np.float32)
+    fourpi_t = (4 * np.pi * t).astype(np.float32)
+    unit_shapes = {
+        'SIN': np.sin(twopi_t),
+        'TRI': _gen_shape(SHAPE_TRIANGLE, t_mod1, 1.0, 0.0, 0.0, np.empty_like(t)),
+        'RAMP': _gen_shape(SHAPE_RAMP, t_mod1, 1.0, 0.0, 0.0, np.empty_like(t)),
+        'ARB': np.sin(twopi_t) * np.cos(fourpi_t),
+    }
+    for arr in unit_shapes.values():
+        arr.setflags(write=False)
+    return t, t_mod1, unit_shapes
+
+# Shared stylesheets, built once at import (see set_light_theme / get_button_style)
+_GROUPBOX_QSS = """
+    QGroupBox {
+        background-color: #ffffff;
+        border: 2px solid #e8eaed;
+        border-radius: 10px;
+        margin-top: 12px;
+        padding: 15px;
+        font-weight: bold;
+        color: #1a73e8;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 8px;
+        background-color: #ffffff;
+    }
+"""
+
+_SPINBOX_QSS = """
+    QSpinBox, QDoubleSpinBox {
+        border: 2px solid #dadce0;
+        border-radius: 6px;
+        padding: 6px;
+        background-color: #ffffff;
+        color: #3c4043;
+        font-size: 10px;
+    }
+    QSpinBox:focus, QDoubleSpinBox:focus { border: 2px solid #1a73e8; }
+"""
+
+_INPUT_QSS = """
+    QComboBox, QLineEdit {
+        border: 2px solid #dadce0;
+        border-radius: 6px;
+        padding: 6px;
+        background-color: #ffffff;
+        color: #3c4043;
+        font-size: 10px;
+    }
+    QComboBox:focus, QLineEdit:focus { border: 2px solid #1a73e8; }
+    QComboBox::drop-down { border: none; padding-right: 8px; }
+"""
+
+_RADIO_QSS = """
+    QRadioButton { color: #3c4043; spacing: 8px; }
+    QRadioButton::indicator { width: 18px; height: 18px; }
+    QRadioButton::indicator:unchecked {
+        border: 2px solid #dadce0; border-radius: 9px; background-color: white;
+    }
+    QRadioButton::indicator:checked {
+        border: 2px solid #1a73e8; border-radius: 9px; background-color: #1a73e8;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _button_qss(color):
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 12px 24px;
+            font-weight: bold;
+            font-size: 11px;
+        }}
+        QPushButton:hover {{ background-color: {color}; opacity: 0.9; }}
+        QPushButton:pressed {{ background-color: {color}; }}
+    """
 
 
 class FlowLayout(QLayout):
@@ -41,12 +252,14 @@ class FlowLayout(QLayout):
     def __init__(self, parent=None, margin=0, spacing=-1):
         super().__init__(parent)
         self._items = []
+        self._height_cache = {}
         self._spacing = spacing if spacing >= 0 else 8
         if margin >= 0:
             self.setContentsMargins(margin, margin, margin, margin)
 
     def addItem(self, item):
         self._items.append(item)
+        self._height_cache.clear()
 
     def count(self):
         return len(self._items)
@@ -58,9 +271,14 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._items):
+            self._height_cache.clear()
             return self._items.pop(index)
         return None
 
+    def invalidate(self):
+        self._height_cache.clear()
+        super().invalidate()
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -86,26 +304,30 @@ class FlowLayout(QLayout):
         return size
 
     def _doLayout(self, rect, testOnly):
+        # heightForWidth is queried repeatedly with the same width during layout negotiation
+        cache_key = (rect.width(), tuple(id(item) for item in self._items))
+        if testOnly and cache_key in self._height_cache:
+            return self._height_cache[cache_key]
+
         margins = self.contentsMargins()
         effective_rect = rect.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
-        x = effective_rect.x()
-        y = effective_rect.y()
+        hints = [item.sizeHint() for item in self._items]
         rows = []
         current_row_items = []
         current_line_height = 0
         current_x = effective_rect.x()
 
-        for item in self._items:
+        for item, hint in zip(self._items, hints):
             space_x = self._spacing
-            next_x = current_x + item.sizeHint().width() + space_x
+            next_x = current_x + hint.width() + space_x
             if next_x - space_x > effective_rect.right() and current_line_height > 0:
                 rows.append((current_row_items, current_line_height))
                 current_row_items = []
                 current_line_height = 0
                 current_x = effective_rect.x()
-                next_x = current_x + item.sizeHint().width() + space_x
-            current_row_items.append(item)
-            current_line_height = max(current_line_height, item.sizeHint().height())
+                next_x = current_x + hint.width() + space_x
+            current_row_items.append((item, hint))
+            current_line_height = max(current_line_height, hint.height())
             current_x = next_x
 
         if current_row_items:
@@ -115,11 +337,10 @@ class FlowLayout(QLayout):
             y = effective_rect.y()
             for row_items, row_height in rows:
                 x = effective_rect.x()
-                for item in row_items:
-                    item_height = item.sizeHint().height()
-                    item_y = y + (row_height - item_height) // 2
-                    item.setGeometry(QRect(QPoint(x, item_y), item.sizeHint()))
-                    x += item.sizeHint().width() + self._spacing
+                for item, hint in row_items:
+                    item_y = y + (row_height - hint.height()) // 2
+                    item.setGeometry(QRect(QPoint(x, item_y), hint))
+                    x += hint.width() + self._spacing
                 y += row_height + self._spacing
 
         total_height = 0
@@ -128,22 +349,90 @@ class FlowLayout(QLayout):
         if rows:
             total_height -= self._spacing
 
-        return margins.top() + total_height + margins.bottom()
+        height = margins.top() + total_height + margins.bottom()
+        self._height_cache[cache_key] = height
+        return height
+
+
+class VisaWorkerSignals(QObject):
+    """Signals used by VisaWorker to report back to the GUI thread"""
+    finished = pyqtSignal(object, bool, object, str)  # worker, success, payload, error
+
+
+class VisaWorker(QRunnable):
+    """Runs one blocking VISA job on the global QThreadPool"""
+
+    def __init__(self, job, on_done, button=None):
+        super().__init__()
+        self.job = job
+        self.on_done = on_done
+        self.button = button
+        self.signals = VisaWorkerSignals()
+        # Lifetime is managed from Python (the GUI keeps a reference until finished is handled)
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            payload = self.job()
+        except Exception as e:
+            self.signals.finished.emit(self, False, None, str(e))
+        else:
+            self.signals.finished.emit(self, True, payload, "")
+
+
+def require_visa(handler):
+    """Run an instrument handler only when a resource is selected and PyVISA is installed.
+
+    The wrapped handler receives the selected resource name as its only argument.
+    """
+    @functools.wraps(handler)
+    def wrapper(self):
+        resource_name = self.resource_combo.currentText().strip()
+        if not resource_name:
+            QMessageBox.warning(self, "No Resource", "Please select a VISA resource first.")
+            return
+        if not PYVISA_AVAILABLE:
+            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
+            return
+        return handler(self, resource_name)
+    return wrapper
 
 
 class Keysight33500BGeneratorGUI(QMainWindow):
     """Main GUI window for Keysight 33500B Waveform Generator application"""
 
+    # Frequency unit combo text -> Hz multiplier
+    FREQ_MULT = {"Hz": 1, "kHz": 1_000, "MHz": 1_000_000}
+    # Load combo text -> OUTPut:LOAD argument (anything else is High-Z)
+    LOAD_MAP = {"50 Ω": "50"}
+
     def __init__(self):
         super().__init__()
         self.current_waveform = "SIN"
         self.output_enabled_ch1 = False
         self.output_enabled_ch2 = False
         self.current_channel = 1
+        self._rm = None
+        self._inst_cache = {}
+        self._visa_lock = QMutex()  # serialises access to the cached sessions across workers
+        self._close_pending = False  # set when a close request found the lock busy
+        self._active_workers = set()
+        self._res_cache = None  # (monotonic time, resources) of the last scan
+        self._status_log = deque(maxlen=STATUS_LOG_MAX_ENTRIES)  # newest entry first
+        self._waveform_widgets = {}
+        self._waveform_widgets_ready = False
+        self._last_preview_key = None
+        self._preview_antialias = True
+        # Noise/PRBS preview samples are drawn once; redraws only rescale them
+        self._rng_nois = np.random.default_rng(42)
+        self._rng_prbs = np.random.default_rng(7)
+        self._nois_buf = self._rng_nois.standard_normal(PREVIEW_MAX_SAMPLES).astype(np.float32)
+        self._prbs_buf = np.where(self._rng_prbs.random(PREVIEW_MAX_SAMPLES) > 0.5, 1.0, -1.0).astype(np.float32)
         self.init_ui()
 
     def init_ui(self):
         """Initialize the user interface"""
+        _init_fonts()
         self.setWindowTitle("Keysight 33500B Series Waveform Generator Control Panel")
         self.setGeometry(0, 0, 1920, 1080)
         self.set_light_theme()
@@ -182,14 +471,14 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         # Title
         title = QLabel("〰️ Keysight 33500B Series Function/Arbitrary Waveform Generator")
-        title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        title.setFont(_FONT_TITLE)
         title.setStyleSheet("color: #1a73e8; padding: 10px;")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title)
 
         # Subtitle
         subtitle = QLabel("30 MHz | Dual Channel | Modulation | Arb | PRBS")
-        subtitle.setFont(QFont("Segoe UI", 10))
+        subtitle.setFont(_FONT_UI_10)
         subtitle.setStyleSheet("color: #5f6368; padding-bottom: 5px;")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(subtitle)
@@ -217,12 +506,11 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         main_layout.addLayout(bottom_layout, 1)
 
         status_group = QGroupBox("📊 Instrument Status")
-        status_group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        status_group.setStyleSheet(self.get_groupbox_style())
+        status_group.setFont(_FONT_GROUP)
         status_layout = QVBoxLayout()
         self.status_text = QTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFont(QFont("Consolas", 9))
+        self.status_text.setFont(_FONT_CONSOLE)
         self.status_text.setStyleSheet("""
             QTextEdit {
                 background-color: #f8f9fa;
@@ -252,12 +540,34 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("✨ Ready - Keysight 33500B Waveform Generator Control")
 
+        # Coalesce bursts of parameter changes into a single preview redraw
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(40)
+        self._preview_timer.timeout.connect(self._render_interim_preview)
+
+        # Once the values stop changing, redraw the final frame antialiased
+        self._preview_settle_timer = QTimer(self)
+        self._preview_settle_timer.setSingleShot(True)
+        self._preview_settle_timer.setInterval(200)
+        self._preview_settle_timer.timeout.connect(self._render_settled_preview)
+
+        # Reusable sample buffer for the preview; sliced to the current sample count
+        self._ybuf = np.empty(PREVIEW_MAX_SAMPLES, dtype=np.float32)
+
+        # Compile the shape kernel now so the first waveform switch does not stall
+        # (the time grids it is called with are read-only, so warm it up with one too)
+        if NUMBA_AVAILABLE:
+            warmup_t = np.zeros(1, dtype=np.float32)
+            warmup_t.setflags(write=False)
+            _gen_shape(SHAPE_SQUARE, warmup_t, 1.0, 0.0, 0.5, np.empty(1, dtype=np.float32))
+
         # Connect signals
-        self.frequency_spin.valueChanged.connect(self.update_waveform_preview)
-        self.freq_unit_combo.currentTextChanged.connect(self.update_waveform_preview)
-        self.amplitude_spin.valueChanged.connect(self.update_waveform_preview)
-        self.offset_spin.valueChanged.connect(self.update_waveform_preview)
-        self.duty_spin.valueChanged.connect(self.update_waveform_preview)
+        self.frequency_spin.valueChanged.connect(self._schedule_preview)
+        self.freq_unit_combo.currentTextChanged.connect(self._schedule_preview)
+        self.amplitude_spin.valueChanged.connect(self._schedule_preview)
+        self.offset_spin.valueChanged.connect(self._schedule_preview)
+        self.duty_spin.valueChanged.connect(self._schedule_preview)
 
         self.update_waveform_preview()
         self.check_dependencies()
@@ -266,29 +576,28 @@ class Keysight33500BGeneratorGUI(QMainWindow):
     def create_connection_group(self):
         """Create connection settings group"""
         group = QGroupBox("🔌 Instrument Connection")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
         layout = QHBoxLayout()
 
         visa_label = QLabel("VISA Resource:")
-        visa_label.setFont(QFont("Segoe UI", 10))
+        visa_label.setFont(_FONT_UI_10)
         layout.addWidget(visa_label)
 
         self.resource_combo = QComboBox()
-        self.resource_combo.setFont(QFont("Segoe UI", 10))
+        self.resource_combo.setFont(_FONT_UI_10)
         self.resource_combo.setEditable(True)
-        self.resource_combo.setStyleSheet(self.get_input_style())
+        self.resource_combo.currentIndexChanged.connect(self._close_cached)
         layout.addWidget(self.resource_combo, 1)
 
-        refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.setStyleSheet(self.get_button_style("#9334e9"))
-        refresh_btn.clicked.connect(self.refresh_resources)
-        layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("🔄 Refresh")
+        self.refresh_btn.setStyleSheet(self.get_button_style("#9334e9"))
+        self.refresh_btn.clicked.connect(self.refresh_resources)
+        layout.addWidget(self.refresh_btn)
 
-        test_btn = QPushButton("🔍 Test Connection")
-        test_btn.setStyleSheet(self.get_button_style("#1a73e8"))
-        test_btn.clicked.connect(self.test_connection)
-        layout.addWidget(test_btn)
+        self.test_btn = QPushButton("🔍 Test Connection")
+        self.test_btn.setStyleSheet(self.get_button_style("#1a73e8"))
+        self.test_btn.clicked.connect(self.test_connection)
+        layout.addWidget(self.test_btn)
 
         group.setLayout(layout)
         return group
@@ -296,22 +605,21 @@ class Keysight33500BGeneratorGUI(QMainWindow):
     def create_channel_selector_group(self):
         """Create channel selector group — unique to 33500B dual-channel"""
         group = QGroupBox("📺 Channel Selection")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
         layout = QHBoxLayout()
 
         ch_label = QLabel("Active Channel:")
-        ch_label.setFont(QFont("Segoe UI", 10))
+        ch_label.setFont(_FONT_UI_10)
         layout.addWidget(ch_label)
 
         self.ch1_btn = QRadioButton("Channel 1 (CH1)")
-        self.ch1_btn.setFont(QFont("Segoe UI", 10))
+        self.ch1_btn.setFont(_FONT_UI_10)
         self.ch1_btn.setChecked(True)
         self.ch1_btn.toggled.connect(lambda checked: self._on_channel_changed(1, checked))
         layout.addWidget(self.ch1_btn)
 
         self.ch2_btn = QRadioButton("Channel 2 (CH2)")
-        self.ch2_btn.setFont(QFont("Segoe UI", 10))
+        self.ch2_btn.setFont(_FONT_UI_10)
         self.ch2_btn.toggled.connect(lambda checked: self._on_channel_changed(2, checked))
         layout.addWidget(self.ch2_btn)
 
@@ -323,7 +631,7 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         # Coupling button
         self.couple_btn = QPushButton("🔗 Couple CH1→CH2")
-        self.couple_btn.setFont(QFont("Segoe UI", 10))
+        self.couple_btn.setFont(_FONT_UI_10)
         self.couple_btn.setStyleSheet(self.get_button_style("#0891b2"))
         self.couple_btn.clicked.connect(self.couple_channels)
         layout.addWidget(self.couple_btn)
@@ -331,7 +639,7 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         layout.addStretch()
 
         self.ch_indicator = QLabel("● CH1 Active")
-        self.ch_indicator.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        self.ch_indicator.setFont(_FONT_UI_10_BOLD)
         self.ch_indicator.setStyleSheet("color: #1a73e8;")
         layout.addWidget(self.ch_indicator)
 
@@ -341,8 +649,7 @@ class Keysight33500BGeneratorGUI(QMainWindow):
     def create_waveform_type_group(self):
         """Create waveform type selection group"""
         group = QGroupBox("〰️ Waveform Type")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
 
         layout = QHBoxLayout()
         self.waveform_group = QButtonGroup()
@@ -362,22 +669,14 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         for i, (label, wave_type) in enumerate(waveforms):
             radio = QRadioButton(label)
-            radio.setFont(QFont("Segoe UI", 10))
-            radio.setStyleSheet("""
-                QRadioButton { color: #3c4043; spacing: 8px; }
-                QRadioButton::indicator { width: 18px; height: 18px; }
-                QRadioButton::indicator:unchecked {
-                    border: 2px solid #dadce0; border-radius: 9px; background-color: white;
-                }
-                QRadioButton::indicator:checked {
-                    border: 2px solid #1a73e8; border-radius: 9px; background-color: #1a73e8;
-                }
-            """)
+            radio.setFont(_FONT_UI_10)
             radio.toggled.connect(lambda checked, w=wave_type: self.on_waveform_changed(checked, w))
             self.waveform_group.addButton(radio, i)
             layout.addWidget(radio)
             if i == 0:
-                radio.setChecked(True)
+                # current_waveform already defaults to SIN; don't fire the handler during setup
+                with QSignalBlocker(radio):
+                    radio.setChecked(True)
 
         group.setLayout(layout)
         return group
@@ -385,8 +684,7 @@ class Keysight33500BGeneratorGUI(QMainWindow):
     def create_waveform_settings_group(self):
         """Create waveform settings group"""
         group = QGroupBox("⚙️ Waveform Parameters")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
 
         row_layout = QHBoxLayout()
         row_layout.setSpacing(10)
@@ -394,15 +692,14 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         # --- Frequency ---
         freq_label = QLabel("Frequency:")
-        freq_label.setFont(QFont("Segoe UI", 10))
+        freq_label.setFont(_FONT_UI_10)
         row_layout.addWidget(freq_label)
 
         self.frequency_spin = QDoubleSpinBox()
         self.frequency_spin.setRange(0.000001, 30000000)  # 1 µHz – 30 MHz
         self.frequency_spin.setValue(1000)
         self.frequency_spin.setDecimals(6)
-        self.frequency_spin.setFont(QFont("Segoe UI", 10))
-        self.frequency_spin.setStyleSheet(self.get_spinbox_style())
+        self.frequency_spin.setFont(_FONT_UI_10)
         self.frequency_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         self.frequency_spin.setMinimumWidth(140)
         row_layout.addWidget(self.frequency_spin)
@@ -410,8 +707,7 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         self.freq_unit_combo = QComboBox()
         self.freq_unit_combo.addItems(["Hz", "kHz", "MHz"])
         self.freq_unit_combo.setCurrentText("kHz")
-        self.freq_unit_combo.setFont(QFont("Segoe UI", 10))
-        self.freq_unit_combo.setStyleSheet(self.get_input_style())
+        self.freq_unit_combo.setFont(_FONT_UI_10)
         self.freq_unit_combo.setFixedWidth(65)
         row_layout.addWidget(self.freq_unit_combo)
 
@@ -419,55 +715,52 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         # --- Amplitude ---
         amp_label = QLabel("Amplitude:")
-        amp_label.setFont(QFont("Segoe UI", 10))
+        amp_label.setFont(_FONT_UI_10)
         row_layout.addWidget(amp_label)
 
         self.amplitude_spin = QDoubleSpinBox()
         self.amplitude_spin.setRange(0.001, 10.0)  # 1 mVpp – 10 Vpp
         self.amplitude_spin.setValue(1.0)
         self.amplitude_spin.setDecimals(3)
-        self.amplitude_spin.setFont(QFont("Segoe UI", 10))
-        self.amplitude_spin.setStyleSheet(self.get_spinbox_style())
+        self.amplitude_spin.setFont(_FONT_UI_10)
         self.amplitude_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         self.amplitude_spin.setMinimumWidth(110)
         row_layout.addWidget(self.amplitude_spin)
 
         amp_unit_label = QLabel("Vpp")
-        amp_unit_label.setFont(QFont("Segoe UI", 10))
+        amp_unit_label.setFont(_FONT_UI_10)
         row_layout.addWidget(amp_unit_label)
 
         row_layout.addSpacing(8)
 
         # --- DC Offset ---
         offset_label = QLabel("DC Offset:")
-        offset_label.setFont(QFont("Segoe UI", 10))
+        offset_label.setFont(_FONT_UI_10)
         row_layout.addWidget(offset_label)
 
         self.offset_spin = QDoubleSpinBox()
         self.offset_spin.setRange(-5.0, 5.0)
         self.offset_spin.setValue(0.0)
         self.offset_spin.setDecimals(3)
-        self.offset_spin.setFont(QFont("Segoe UI", 10))
-        self.offset_spin.setStyleSheet(self.get_spinbox_style())
+        self.offset_spin.setFont(_FONT_UI_10)
         self.offset_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         self.offset_spin.setMinimumWidth(110)
         row_layout.addWidget(self.offset_spin)
 
         offset_unit_label = QLabel("V")
-        offset_unit_label.setFont(QFont("Segoe UI", 10))
+        offset_unit_label.setFont(_FONT_UI_10)
         row_layout.addWidget(offset_unit_label)
 
         row_layout.addSpacing(8)
 
         # --- Output Load ---
         load_label = QLabel("Load:")
-        load_label.setFont(QFont("Segoe UI", 10))
+        load_label.setFont(_FONT_UI_10)
         row_layout.addWidget(load_label)
 
         self.load_combo = QComboBox()
         self.load_combo.addItems(["50 Ω", "High-Z"])
-        self.load_combo.setFont(QFont("Segoe UI", 10))
-        self.load_combo.setStyleSheet(self.get_input_style())
+        self.load_combo.setFont(_FONT_UI_10)
         self.load_combo.setFixedWidth(80)
         row_layout.addWidget(self.load_combo)
 
@@ -475,40 +768,38 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         # --- Duty Cycle (for Square) ---
         self.duty_label = QLabel("Duty Cycle:")
-        self.duty_label.setFont(QFont("Segoe UI", 10))
+        self.duty_label.setFont(_FONT_UI_10)
         row_layout.addWidget(self.duty_label)
 
         self.duty_spin = QDoubleSpinBox()
         self.duty_spin.setRange(0.01, 99.99)
         self.duty_spin.setValue(50)
         self.duty_spin.setDecimals(2)
-        self.duty_spin.setFont(QFont("Segoe UI", 10))
-        self.duty_spin.setStyleSheet(self.get_spinbox_style())
+        self.duty_spin.setFont(_FONT_UI_10)
         self.duty_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         self.duty_spin.setMinimumWidth(90)
         row_layout.addWidget(self.duty_spin)
 
         duty_unit_label = QLabel("%")
-        duty_unit_label.setFont(QFont("Segoe UI", 10))
+        duty_unit_label.setFont(_FONT_UI_10)
         row_layout.addWidget(duty_unit_label)
 
         # --- Pulse Width (for Pulse) ---
         self.pulse_width_label = QLabel("Pulse Width:")
-        self.pulse_width_label.setFont(QFont("Segoe UI", 10))
+        self.pulse_width_label.setFont(_FONT_UI_10)
         row_layout.addWidget(self.pulse_width_label)
 
         self.pulse_width_spin = QDoubleSpinBox()
         self.pulse_width_spin.setRange(16e-9, 1000)
         self.pulse_width_spin.setValue(5e-6)
         self.pulse_width_spin.setDecimals(9)
-        self.pulse_width_spin.setFont(QFont("Segoe UI", 10))
-        self.pulse_width_spin.setStyleSheet(self.get_spinbox_style())
+        self.pulse_width_spin.setFont(_FONT_UI_10)
         self.pulse_width_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         self.pulse_width_spin.setMinimumWidth(120)
         row_layout.addWidget(self.pulse_width_spin)
 
         pulse_width_unit = QLabel("s")
-        pulse_width_unit.setFont(QFont("Segoe UI", 10))
+        pulse_width_unit.setFont(_FONT_UI_10)
         row_layout.addWidget(pulse_width_unit)
 
         # Initially hide pulse width and duty cycle
@@ -521,6 +812,13 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         pulse_width_unit.hide()
         self.pulse_width_unit_ref = pulse_width_unit
 
+        # Parameter widgets that are only shown for one waveform type
+        self._waveform_widgets = {
+            "SQU": [self.duty_label, self.duty_spin, self.duty_unit_label_ref],
+            "PULS": [self.pulse_width_label, self.pulse_width_spin, self.pulse_width_unit_ref],
+        }
+        self._waveform_widgets_ready = True
+
         row_layout.addStretch()
         group.setLayout(row_layout)
         return group
@@ -528,12 +826,24 @@ class Keysight33500BGeneratorGUI(QMainWindow):
     def create_waveform_preview_group(self):
         """Create waveform preview graph group"""
         group = QGroupBox("📈 Waveform Preview")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
 
-        if MATPLOTLIB_AVAILABLE:
+        if PYQTGRAPH_AVAILABLE:
+            self.preview_plot = pg.PlotWidget(background='#f8f9fa')
+            self.preview_plot.setMinimumHeight(250)
+            self.preview_plot.showGrid(x=True, y=True, alpha=0.3)
+            self.preview_plot.setLabel('bottom', 'Time (cycles)', color='#5f6368')
+            self.preview_plot.setLabel('left', 'Voltage (V)', color='#5f6368')
+            self.preview_plot.setMouseEnabled(x=False, y=False)
+            self.preview_plot.hideButtons()
+            self._curve = self.preview_plot.plot(pen=pg.mkPen('#1a73e8', width=2), fillLevel=0.0)
+            self._hline = pg.InfiniteLine(angle=0, pen=pg.mkPen('#9ca3af', style=Qt.PenStyle.DashLine))
+            self.preview_plot.addItem(self._hline)
+            layout.addWidget(self.preview_plot)
+        elif MATPLOTLIB_AVAILABLE:
+            _load_matplotlib()
             self.preview_figure = Figure(figsize=(8, 3.5), dpi=96, facecolor='#f8f9fa')
             self.preview_canvas = FigureCanvas(self.preview_figure)
             self.preview_canvas.setMinimumHeight(250)
@@ -541,18 +851,33 @@ class Keysight33500BGeneratorGUI(QMainWindow):
             self.preview_figure.subplots_adjust(left=0.09, right=0.97, top=0.88, bottom=0.18)
             layout.addWidget(self.preview_canvas)
         else:
-            no_graph_label = QLabel("⚠️ matplotlib not installed.\nInstall with: pip install matplotlib")
+            no_graph_label = QLabel("⚠️ pyqtgraph / matplotlib not installed.\nInstall with: pip install pyqtgraph")
             no_graph_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_graph_label.setFont(QFont("Segoe UI", 10))
+            no_graph_label.setFont(_FONT_UI_10)
             no_graph_label.setStyleSheet("color: #f59e0b; padding: 20px;")
             layout.addWidget(no_graph_label)
 
         group.setLayout(layout)
         return group
 
+    def _schedule_preview(self, *args):
+        """Request a preview redraw; restarts the debounce timer"""
+        self._preview_timer.start()
+
+    def _render_interim_preview(self):
+        """Fast aliased redraw while values are still changing"""
+        self._preview_antialias = False
+        self.update_waveform_preview()
+        self._preview_settle_timer.start()
+
+    def _render_settled_preview(self):
+        """Final antialiased redraw once values have settled"""
+        self._preview_antialias = True
+        self.update_waveform_preview()
+
     def update_waveform_preview(self):
         """Redraw the waveform preview based on current settings"""
-        if not MATPLOTLIB_AVAILABLE or not hasattr(self, 'preview_ax'):
+        if not hasattr(self, 'preview_plot') and not hasattr(self, 'preview_ax'):
             return
 
         freq_value = self.frequency_spin.value() if hasattr(self, 'frequency_spin') else 1000
@@ -562,49 +887,54 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         duty = self.duty_spin.value() if hasattr(self, 'duty_spin') else 50.0
         waveform = self.current_waveform
 
-        if freq_unit == 'kHz':
-            freq_hz = freq_value * 1000
-        elif freq_unit == 'MHz':
-            freq_hz = freq_value * 1_000_000
-        else:
-            freq_hz = freq_value
+        freq_hz = freq_value * self.FREQ_MULT[freq_unit]
 
-        n_cycles = 3
-        t = np.linspace(0, n_cycles, 1000)
+        n = self._preview_sample_count()
 
+        # Nothing visible changed since the last render (e.g. spinbox clamped at its limit)
+        key = (waveform, freq_hz, amplitude, offset, duty, self.current_channel, n, self._preview_antialias)
+        if key == self._last_preview_key:
+            return
+
+        t, t_mod1, unit_shapes = _preview_grid(n)
+
+        y = self._ybuf[:n]
         if waveform == 'SIN':
-            y = amplitude * np.sin(2 * np.pi * t) + offset
+            np.multiply(unit_shapes['SIN'], amplitude, out=y)
+            y += offset
             color = '#1a73e8'; label = 'Sine'
         elif waveform == 'SQU':
-            duty_frac = duty / 100.0
-            y = amplitude * np.where((t % 1) < duty_frac, 1.0, -1.0) + offset
+            _gen_shape(SHAPE_SQUARE, t_mod1, amplitude, offset, duty / 100.0, y)
             color = '#16a34a'; label = f'Square ({duty:.0f}% duty)'
         elif waveform == 'TRI':
-            y = amplitude * (2 * np.abs(2 * (t % 1) - 1) - 1) + offset
+            np.multiply(unit_shapes['TRI'], amplitude, out=y)
+            y += offset
             color = '#9334e9'; label = 'Triangle'
         elif waveform == 'RAMP':
-            y = amplitude * (2 * (t % 1) - 1) + offset
+            np.multiply(unit_shapes['RAMP'], amplitude, out=y)
+            y += offset
             color = '#f59e0b'; label = 'Ramp'
         elif waveform == 'PULS':
-            duty_frac = duty / 100.0
-            y = amplitude * np.where((t % 1) < duty_frac, 1.0, -1.0) + offset
+            _gen_shape(SHAPE_SQUARE, t_mod1, amplitude, offset, duty / 100.0, y)
             color = '#dc2626'; label = f'Pulse ({duty:.0f}% duty)'
         elif waveform == 'NOIS':
-            np.random.seed(42)
-            y = amplitude * np.random.randn(len(t)) + offset
+            np.multiply(self._nois_buf[:n], amplitude, out=y)
+            y += offset
             color = '#6b7280'; label = 'Noise'
         elif waveform == 'PRBS':
-            np.random.seed(7)
-            y = amplitude * np.where(np.random.rand(len(t)) > 0.5, 1.0, -1.0) + offset
+            np.multiply(self._prbs_buf[:n], amplitude, out=y)
+            y += offset
             color = '#ea580c'; label = 'PRBS'
         elif waveform == 'ARB':
-            y = amplitude * np.sin(2 * np.pi * t) * np.cos(4 * np.pi * t) + offset
+            np.multiply(unit_shapes['ARB'], amplitude, out=y)
+            y += offset
             color = '#7c3aed'; label = 'Arbitrary'
         elif waveform == 'DC':
-            y = np.full_like(t, offset)
+            y.fill(offset)
             color = '#0891b2'; label = 'DC'
         else:
-            y = amplitude * np.sin(2 * np.pi * t) + offset
+            np.multiply(unit_shapes['SIN'], amplitude, out=y)
+            y += offset
             color = '#1a73e8'; label = waveform
 
         if freq_hz >= 1_000_000:
@@ -614,20 +944,47 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         else:
             freq_label = f'{freq_hz:.3g} Hz'
 
+        ch_str = f"CH{self.current_channel}"
+        title = f'[{ch_str}] {label}  |  {freq_label}  |  {amplitude:.3g} Vpp  |  Offset: {offset:+.3g} V'
+        y_range = max(abs(amplitude), 0.01)
+
+        if hasattr(self, 'preview_plot'):
+            self._draw_preview_pyqtgraph(t, y, color, title, offset, y_range, PREVIEW_CYCLES)
+        else:
+            self._draw_preview_matplotlib(t, y, color, title, offset, y_range, PREVIEW_CYCLES)
+        self._last_preview_key = key
+
+    def _preview_sample_count(self):
+        """Number of preview samples needed to cover the plot at screen resolution"""
+        widget = self.preview_plot if hasattr(self, 'preview_plot') else self.preview_canvas
+        n = int(widget.width() * 1.5)
+        return max(PREVIEW_MIN_SAMPLES, min(PREVIEW_MAX_SAMPLES, n))
+
+    def _draw_preview_pyqtgraph(self, t, y, color, title, offset, y_range, n_cycles):
+        """Update the persistent pyqtgraph curve in place"""
+        fill = pg.mkColor(color)
+        fill.setAlpha(30)
+        self._curve.setData(t, y, antialias=self._preview_antialias)
+        self._curve.setPen(pg.mkPen(color, width=2))
+        self._curve.setFillLevel(offset)
+        self._curve.setBrush(fill)
+        self._hline.setPos(offset)
+        self.preview_plot.setTitle(title, color='#3c4043', size='9pt', bold=True)
+        self.preview_plot.setXRange(0, n_cycles, padding=0)
+        self.preview_plot.setYRange(offset - y_range * 1.4, offset + y_range * 1.4, padding=0)
+
+    def _draw_preview_matplotlib(self, t, y, color, title, offset, y_range, n_cycles):
+        """Fallback preview renderer when pyqtgraph is not installed"""
         self.preview_ax.clear()
-        self.preview_ax.plot(t, y, color=color, linewidth=1.8, antialiased=True)
+        self.preview_ax.plot(t, y, color=color, linewidth=1.8, antialiased=self._preview_antialias)
         self.preview_ax.axhline(y=offset, color='#9ca3af', linewidth=0.8, linestyle='--', alpha=0.7)
         self.preview_ax.fill_between(t, offset, y, alpha=0.12, color=color)
 
-        ch_str = f"CH{self.current_channel}"
         self.preview_ax.set_facecolor('#f8f9fa')
         self.preview_figure.patch.set_facecolor('#f8f9fa')
         self.preview_ax.set_xlabel('Time (cycles)', fontsize=8, color='#5f6368')
         self.preview_ax.set_ylabel('Voltage (V)', fontsize=8, color='#5f6368')
-        self.preview_ax.set_title(
-            f'[{ch_str}] {label}  |  {freq_label}  |  {amplitude:.3g} Vpp  |  Offset: {offset:+.3g} V',
-            fontsize=9, color='#3c4043', fontweight='bold', pad=6
-        )
+        self.preview_ax.set_title(title, fontsize=9, color='#3c4043', fontweight='bold', pad=6)
         self.preview_ax.tick_params(labelsize=7, colors='#5f6368')
         self.preview_ax.spines['top'].set_visible(False)
         self.preview_ax.spines['right'].set_visible(False)
@@ -635,16 +992,13 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         self.preview_ax.spines['bottom'].set_color('#dadce0')
         self.preview_ax.grid(True, linestyle='--', alpha=0.4, color='#dadce0')
         self.preview_ax.set_xlim(0, n_cycles)
-
-        y_range = max(abs(amplitude), 0.01)
         self.preview_ax.set_ylim(offset - y_range * 1.4, offset + y_range * 1.4)
         self.preview_canvas.draw()
 
     def create_modulation_group(self):
         """Create modulation settings group"""
         group = QGroupBox("📡 Modulation")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
 
         layout = QVBoxLayout()
         layout.setSpacing(12)
@@ -652,13 +1006,12 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         mod_type_layout = QHBoxLayout()
 
         mod_label = QLabel("Modulation Type:")
-        mod_label.setFont(QFont("Segoe UI", 10))
+        mod_label.setFont(_FONT_UI_10)
         mod_type_layout.addWidget(mod_label)
 
         self.modulation_combo = QComboBox()
         self.modulation_combo.addItems(["None", "AM", "FM", "PM", "FSK", "BPSK", "Sweep", "Burst"])
-        self.modulation_combo.setFont(QFont("Segoe UI", 10))
-        self.modulation_combo.setStyleSheet(self.get_input_style())
+        self.modulation_combo.setFont(_FONT_UI_10)
         self.modulation_combo.currentTextChanged.connect(self.on_modulation_changed)
         mod_type_layout.addWidget(self.modulation_combo)
         mod_type_layout.addStretch()
@@ -669,50 +1022,47 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
         # AM Depth
         self.am_depth_label = QLabel("AM Depth:")
-        self.am_depth_label.setFont(QFont("Segoe UI", 10))
+        self.am_depth_label.setFont(_FONT_UI_10)
         mod_params_layout.addWidget(self.am_depth_label)
         self.am_depth_spin = QDoubleSpinBox()
         self.am_depth_spin.setRange(0, 120)
         self.am_depth_spin.setValue(50)
         self.am_depth_spin.setDecimals(1)
-        self.am_depth_spin.setFont(QFont("Segoe UI", 10))
-        self.am_depth_spin.setStyleSheet(self.get_spinbox_style())
+        self.am_depth_spin.setFont(_FONT_UI_10)
         self.am_depth_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         mod_params_layout.addWidget(self.am_depth_spin)
         am_unit = QLabel("%")
-        am_unit.setFont(QFont("Segoe UI", 10))
+        am_unit.setFont(_FONT_UI_10)
         mod_params_layout.addWidget(am_unit)
 
         # FM Deviation
         self.fm_dev_label = QLabel("FM Deviation:")
-        self.fm_dev_label.setFont(QFont("Segoe UI", 10))
+        self.fm_dev_label.setFont(_FONT_UI_10)
         mod_params_layout.addWidget(self.fm_dev_label)
         self.fm_dev_spin = QDoubleSpinBox()
         self.fm_dev_spin.setRange(0, 15000000)
         self.fm_dev_spin.setValue(1000)
         self.fm_dev_spin.setDecimals(1)
-        self.fm_dev_spin.setFont(QFont("Segoe UI", 10))
-        self.fm_dev_spin.setStyleSheet(self.get_spinbox_style())
+        self.fm_dev_spin.setFont(_FONT_UI_10)
         self.fm_dev_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         mod_params_layout.addWidget(self.fm_dev_spin)
         fm_unit = QLabel("Hz")
-        fm_unit.setFont(QFont("Segoe UI", 10))
+        fm_unit.setFont(_FONT_UI_10)
         mod_params_layout.addWidget(fm_unit)
 
         # Mod Frequency
         self.mod_freq_label = QLabel("Mod Frequency:")
-        self.mod_freq_label.setFont(QFont("Segoe UI", 10))
+        self.mod_freq_label.setFont(_FONT_UI_10)
         mod_params_layout.addWidget(self.mod_freq_label)
         self.mod_freq_spin = QDoubleSpinBox()
         self.mod_freq_spin.setRange(0.001, 20000)
         self.mod_freq_spin.setValue(100)
         self.mod_freq_spin.setDecimals(3)
-        self.mod_freq_spin.setFont(QFont("Segoe UI", 10))
-        self.mod_freq_spin.setStyleSheet(self.get_spinbox_style())
+        self.mod_freq_spin.setFont(_FONT_UI_10)
         self.mod_freq_spin.setLocale(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         mod_params_layout.addWidget(self.mod_freq_spin)
         mod_freq_unit = QLabel("Hz")
-        mod_freq_unit.setFont(QFont("Segoe UI", 10))
+        mod_freq_unit.setFont(_FONT_UI_10)
         mod_params_layout.addWidget(mod_freq_unit)
 
         self.mod_params_widget.setLayout(mod_params_layout)
@@ -724,37 +1074,36 @@ class Keysight33500BGeneratorGUI(QMainWindow):
     def create_output_control_group(self):
         """Create output control group"""
         group = QGroupBox("🔊 Output Control")
-        group.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        group.setStyleSheet(self.get_groupbox_style())
+        group.setFont(_FONT_GROUP)
         layout = QHBoxLayout()
 
         self.output_btn = QPushButton("🔴 Output OFF")
-        self.output_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.output_btn.setFont(_FONT_BUTTON)
         self.output_btn.setMinimumHeight(50)
         self.output_btn.setStyleSheet(self.get_button_style("#dc2626"))
         self.output_btn.clicked.connect(self.toggle_output)
         layout.addWidget(self.output_btn, 1)
 
-        apply_btn = QPushButton("⚙️ Apply Settings")
-        apply_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        apply_btn.setMinimumHeight(50)
-        apply_btn.setStyleSheet(self.get_button_style("#1a73e8"))
-        apply_btn.clicked.connect(self.apply_settings)
-        layout.addWidget(apply_btn, 1)
-
-        recall_btn = QPushButton("📥 Recall Config")
-        recall_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        recall_btn.setMinimumHeight(50)
-        recall_btn.setStyleSheet(self.get_button_style("#9334e9"))
-        recall_btn.clicked.connect(self.recall_config)
-        layout.addWidget(recall_btn, 1)
-
-        reset_btn = QPushButton("🔄 Reset Instrument")
-        reset_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        reset_btn.setMinimumHeight(50)
-        reset_btn.setStyleSheet(self.get_button_style("#f59e0b"))
-        reset_btn.clicked.connect(self.reset_instrument)
-        layout.addWidget(reset_btn, 1)
+        self.apply_btn = QPushButton("⚙️ Apply Settings")
+        self.apply_btn.setFont(_FONT_BUTTON)
+        self.apply_btn.setMinimumHeight(50)
+        self.apply_btn.setStyleSheet(self.get_button_style("#1a73e8"))
+        self.apply_btn.clicked.connect(self.apply_settings)
+        layout.addWidget(self.apply_btn, 1)
+
+        self.recall_btn = QPushButton("📥 Recall Config")
+        self.recall_btn.setFont(_FONT_BUTTON)
+        self.recall_btn.setMinimumHeight(50)
+        self.recall_btn.setStyleSheet(self.get_button_style("#9334e9"))
+        self.recall_btn.clicked.connect(self.recall_config)
+        layout.addWidget(self.recall_btn, 1)
+
+        self.reset_btn = QPushButton("🔄 Reset Instrument")
+        self.reset_btn.setFont(_FONT_BUTTON)
+        self.reset_btn.setMinimumHeight(50)
+        self.reset_btn.setStyleSheet(self.get_button_style("#f59e0b"))
+        self.reset_btn.clicked.connect(self.reset_instrument)
+        layout.addWidget(self.reset_btn, 1)
 
         group.setLayout(layout)
         return group
@@ -765,36 +1114,28 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         if checked:
             self.current_channel = ch_num
             self.ch_indicator.setText(f"● CH{ch_num} Active")
-            self.update_waveform_preview()
+            self._schedule_preview()
             self.update_status_display(f"Active channel switched to CH{ch_num}.")
 
-    def couple_channels(self):
+    @require_visa
+    def couple_channels(self, resource_name):
         """Copy CH1 settings to CH2"""
-        resource_name = self.resource_combo.currentText().strip()
-        if not resource_name:
-            QMessageBox.warning(self, "No Resource", "Please select a VISA resource first.")
-            return
-        if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
-            return
-        try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
-            instrument.timeout = 5000
-            # Copy phase, freq, amp, offset from CH1 to CH2
-            freq = instrument.query("SOURce1:FREQuency?").strip()
-            amp = instrument.query("SOURce1:VOLTage?").strip()
-            offs = instrument.query("SOURce1:VOLTage:OFFSet?").strip()
-            func = instrument.query("SOURce1:FUNCtion?").strip()
-            instrument.write(f"SOURce2:FUNCtion {func}")
-            instrument.write(f"SOURce2:FREQuency {freq}")
-            instrument.write(f"SOURce2:VOLTage {amp}")
-            instrument.write(f"SOURce2:VOLTage:OFFSet {offs}")
-            instrument.close()
+        def job(instrument):
+            # Copy function, freq, amp and offset from CH1 to CH2. FUNCtion? goes first:
+            # after VOLTage:OFFSet? the header path stays at SOURce1:VOLTage:
+            func, freq, amp, offs = (field.strip() for field in instrument.query(
+                "SOURce1:FUNCtion?;FREQuency?;VOLTage?;VOLTage:OFFSet?").split(";"))
+            instrument.write(f":SOURce2:FUNCtion {func};:SOURce2:FREQuency {freq};"
+                             f":SOURce2:VOLTage {amp};:SOURce2:VOLTage:OFFSet {offs}")
+
+        def done(success, payload, error):
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to couple channels:\n{error}")
+                return
             self.update_status_display("CH1 settings copied to CH2 successfully.")
             self.status_bar.showMessage("✅ CH1 coupled to CH2")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to couple channels:\n{str(e)}")
+
+        self._run_visa(resource_name, job, done, self.couple_btn)
 
     # ── Waveform / Modulation change ───────────────────────────────
     def on_waveform_changed(self, checked, waveform_type):
@@ -803,19 +1144,18 @@ class Keysight33500BGeneratorGUI(QMainWindow):
             self.current_waveform = waveform_type
             if hasattr(self, 'status_bar'):
                 self.status_bar.showMessage(f"Waveform type changed to: {waveform_type}")
-            if not hasattr(self, 'duty_label'):
+            if not self._waveform_widgets_ready:
                 return
-            # Show duty cycle for Square only
-            if waveform_type == "SQU":
-                self.duty_label.show(); self.duty_spin.show(); self.duty_unit_label_ref.show()
-            else:
-                self.duty_label.hide(); self.duty_spin.hide(); self.duty_unit_label_ref.hide()
-            # Show pulse width for Pulse only
-            if waveform_type == "PULS":
-                self.pulse_width_label.show(); self.pulse_width_spin.show(); self.pulse_width_unit_ref.show()
-            else:
-                self.pulse_width_label.hide(); self.pulse_width_spin.hide(); self.pulse_width_unit_ref.hide()
-            self.update_waveform_preview()
+            # Show duty cycle for Square only and pulse width for Pulse only,
+            # with repaints suspended so the row is laid out once
+            central = self.centralWidget()
+            central.setUpdatesEnabled(False)
+            for key, widgets in self._waveform_widgets.items():
+                visible = waveform_type == key
+                for widget in widgets:
+                    widget.setVisible(visible)
+            central.setUpdatesEnabled(True)
+            self._schedule_preview()
 
     def on_modulation_changed(self, mod_type):
         """Handle modulation type changes"""
@@ -825,36 +1165,121 @@ class Keysight33500BGeneratorGUI(QMainWindow):
             self.mod_params_widget.show()
 
     # ── VISA instrument control ────────────────────────────────────
+    def _get_resource_manager(self):
+        """Return the shared ResourceManager, creating it on first use"""
+        if self._rm is None:
+            self._rm = _load_pyvisa().ResourceManager()
+        return self._rm
+
+    def _get_instrument(self, resource_name):
+        """Return an open session for resource_name, reusing it across actions"""
+        instrument = self._inst_cache.get(resource_name)
+        if instrument is None:
+            instrument = self._get_resource_manager().open_resource(resource_name, open_timeout=2000)
+            instrument.timeout = 5000
+            instrument.chunk_size = VISA_CHUNK_SIZE
+            # Explicit framing so queries never wait out the timeout looking for an end marker
+            instrument.write_termination = '\n'
+            instrument.read_termination = '\n'
+            instrument.send_end = True
+            if resource_name.upper().endswith("::SOCKET"):
+                # Raw sockets can hold a stale reply from a previous client
+                try:
+                    instrument.clear()
+                except Exception:
+                    pass
+            self._inst_cache[resource_name] = instrument
+        return instrument
+
+    def _close_cached(self, *args):
+        """Close all cached instrument sessions, or defer to the worker holding the lock"""
+        # Never block the GUI thread behind a running transfer; the worker
+        # closes the sessions when it releases the lock
+        if not self._visa_lock.tryLock():
+            self._close_pending = True
+            return
+        try:
+            self._close_sessions()
+        finally:
+            self._visa_lock.unlock()
+
+    def _close_sessions(self):
+        """Close and forget the cached sessions; the caller holds _visa_lock"""
+        self._close_pending = False
+        for instrument in self._inst_cache.values():
+            try:
+                instrument.close()
+            except Exception:
+                pass
+        self._inst_cache.clear()
+
+    def _release_visa_lock(self):
+        """Run a deferred close, then release _visa_lock"""
+        try:
+            if self._close_pending:
+                self._close_sessions()
+        finally:
+            self._visa_lock.unlock()
+
+    def _run_visa(self, resource_name, job, on_done, button=None):
+        """Run job(instrument) on the thread pool; on_done(success, payload, error) runs on the GUI thread"""
+        def task():
+            self._visa_lock.lock()
+            try:
+                if self._close_pending:  # a close raced the previous release
+                    self._close_sessions()
+                return job(self._get_instrument(resource_name))
+            finally:
+                self._release_visa_lock()
+
+        self._start_worker(task, on_done, button)
+
+    def _start_worker(self, task, on_done, button=None):
+        """Run task() on the thread pool, disabling button until it finishes"""
+        worker = VisaWorker(task, on_done, button)
+        worker.signals.finished.connect(self._on_visa_finished)
+        if button is not None:
+            button.setEnabled(False)
+        self._active_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_visa_finished(self, worker, success, payload, error):
+        self._active_workers.discard(worker)
+        if worker.button is not None:
+            worker.button.setEnabled(True)
+        if not success:
+            self._close_cached()  # drop a possibly broken session; reopen on next action
+        worker.on_done(success, payload, error)
+
+    def closeEvent(self, event):
+        # Let in-flight jobs finish so no session is closed under a worker
+        QThreadPool.globalInstance().waitForDone(VISA_CLOSE_WAIT_MS)
+        self._close_cached()
+        super().closeEvent(event)
+
     def _get_ch_prefix(self):
         return f"SOURce{self.current_channel}"
 
     def _get_out_ch(self):
         return f"OUTPut{self.current_channel}"
 
-    def toggle_output(self):
+    @require_visa
+    def toggle_output(self, resource_name):
         """Toggle output on/off for the active channel"""
-        resource_name = self.resource_combo.currentText().strip()
-        if not resource_name:
-            QMessageBox.warning(self, "No Resource", "Please select a VISA resource first.")
-            return
-        if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
-            return
-        try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
-            instrument.timeout = 5000
-            ch = self.current_channel
+        ch = self.current_channel
+        enabled = not (self.output_enabled_ch1 if ch == 1 else self.output_enabled_ch2)
+        state = "ON" if enabled else "OFF"
+        command = f"{self._get_out_ch()}:STATe {state}"
+
+        def done(success, payload, error):
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to toggle output:\n{error}")
+                self.update_status_display(f"ERROR: Failed to toggle output - {error}")
+                return
             if ch == 1:
-                self.output_enabled_ch1 = not self.output_enabled_ch1
-                enabled = self.output_enabled_ch1
+                self.output_enabled_ch1 = enabled
             else:
-                self.output_enabled_ch2 = not self.output_enabled_ch2
-                enabled = self.output_enabled_ch2
-
-            state = "ON" if enabled else "OFF"
-            instrument.write(f"{self._get_out_ch()}:STATe {state}")
-            instrument.close()
+                self.output_enabled_ch2 = enabled
 
             if enabled:
                 self.output_btn.setText(f"🟢 CH{ch} Output ON")
@@ -866,139 +1291,127 @@ class Keysight33500BGeneratorGUI(QMainWindow):
                 self.output_btn.setStyleSheet(self.get_button_style("#dc2626"))
                 self.update_status_display(f"CH{ch} output disabled.")
                 self.status_bar.showMessage(f"⭕ CH{ch} Output is OFF")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to toggle output:\n{str(e)}")
-            self.update_status_display(f"ERROR: Failed to toggle output - {str(e)}")
 
-    def apply_settings(self):
+        self._run_visa(resource_name, lambda instrument: instrument.write(command), done, self.output_btn)
+
+    @require_visa
+    def apply_settings(self, resource_name):
         """Apply current settings to instrument — Keysight 33500B SCPI"""
-        resource_name = self.resource_combo.currentText().strip()
-        if not resource_name:
-            QMessageBox.warning(self, "No Resource", "Please select a VISA resource first.")
-            return
-        if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
-            return
-        try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
-            instrument.timeout = 5000
-            ch = self._get_ch_prefix()
-
-            freq_value = self.frequency_spin.value()
-            freq_unit = self.freq_unit_combo.currentText()
-            if freq_unit == "kHz":
-                frequency = freq_value * 1000
-            elif freq_unit == "MHz":
-                frequency = freq_value * 1000000
-            else:
-                frequency = freq_value
+        ch = self._get_ch_prefix()
+        ch_num = self.current_channel
+        waveform = self.current_waveform
 
-            amplitude = self.amplitude_spin.value()
-            offset = self.offset_spin.value()
-            load = self.load_combo.currentText()
+        freq_value = self.frequency_spin.value()
+        freq_unit = self.freq_unit_combo.currentText()
+        frequency = freq_value * self.FREQ_MULT[freq_unit]
+
+        amplitude = self.amplitude_spin.value()
+        offset = self.offset_spin.value()
+        load = self.load_combo.currentText()
+
+        # 33500B SCPI — channel-aware commands, sent as one message.
+        # Each command starts with ':' so it is resolved from the root.
+        cmds = [
+            f":{ch}:FUNCtion {waveform}",
+            f":{ch}:FREQuency {frequency}",
+            f":{ch}:VOLTage {amplitude}",
+            f":{ch}:VOLTage:OFFSet {offset}",
+        ]
 
-            # 33500B SCPI — channel-aware commands
-            instrument.write(f"{ch}:FUNCtion {self.current_waveform}")
-            instrument.write(f"{ch}:FREQuency {frequency}")
-            instrument.write(f"{ch}:VOLTage {amplitude}")
-            instrument.write(f"{ch}:VOLTage:OFFSet {offset}")
+        # Output load
+        cmds.append(f":{self._get_out_ch()}:LOAD {self.LOAD_MAP.get(load, 'INFinity')}")
 
-            # Output load
-            if load == "50 Ω":
-                instrument.write(f"{self._get_out_ch()}:LOAD 50")
-            else:
-                instrument.write(f"{self._get_out_ch()}:LOAD INFinity")
-
-            # Square duty cycle
-            if self.current_waveform == "SQU":
-                duty = self.duty_spin.value()
-                instrument.write(f"{ch}:FUNCtion:SQUare:DCYCle {duty}")
-
-            # Pulse width
-            if self.current_waveform == "PULS":
-                width = self.pulse_width_spin.value()
-                instrument.write(f"{ch}:FUNCtion:PULSe:WIDTh {width}")
-
-            # Modulation
-            mod_type = self.modulation_combo.currentText()
-            if mod_type != "None":
-                self.apply_modulation(instrument, mod_type)
-
-            instrument.close()
-            msg = (f"CH{self.current_channel} settings applied.\n"
-                   f"Function: {self.current_waveform}  Freq: {freq_value} {freq_unit}  "
+        # Square duty cycle
+        if waveform == "SQU":
+            duty = self.duty_spin.value()
+            cmds.append(f":{ch}:FUNCtion:SQUare:DCYCle {duty}")
+
+        # Pulse width
+        if waveform == "PULS":
+            width = self.pulse_width_spin.value()
+            cmds.append(f":{ch}:FUNCtion:PULSe:WIDTh {width}")
+
+        # Modulation
+        mod_type = self.modulation_combo.currentText()
+        if mod_type != "None":
+            cmds.extend(self._modulation_commands(mod_type))
+
+        message = ";".join(cmds)
+
+        def job(instrument):
+            instrument.write(message)
+            instrument.query("*OPC?")
+
+        def done(success, payload, error):
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to apply settings:\n{error}")
+                self.update_status_display(f"ERROR: Failed to apply settings - {error}")
+                return
+            msg = (f"CH{ch_num} settings applied.\n"
+                   f"Function: {waveform}  Freq: {freq_value} {freq_unit}  "
                    f"Amp: {amplitude} Vpp  Offset: {offset} V")
             self.update_status_display(msg)
-            self.status_bar.showMessage(f"✅ CH{self.current_channel} settings applied: {self.current_waveform} @ {freq_value} {freq_unit}")
+            self.status_bar.showMessage(f"✅ CH{ch_num} settings applied: {waveform} @ {freq_value} {freq_unit}")
             QMessageBox.information(self, "Success", "Settings applied successfully!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to apply settings:\n{str(e)}")
-            self.update_status_display(f"ERROR: Failed to apply settings - {str(e)}")
 
-    def apply_modulation(self, instrument, mod_type):
-        """Apply modulation settings — 33500B SCPI"""
-        ch = self._get_ch_prefix()
-        try:
-            if mod_type == "AM":
-                depth = self.am_depth_spin.value()
-                mod_freq = self.mod_freq_spin.value()
-                instrument.write(f"{ch}:AM:DEPTh {depth}")
-                instrument.write(f"{ch}:AM:INTernal:FREQuency {mod_freq}")
-                instrument.write(f"{ch}:AM:STATe ON")
-            elif mod_type == "FM":
-                deviation = self.fm_dev_spin.value()
-                mod_freq = self.mod_freq_spin.value()
-                instrument.write(f"{ch}:FM:DEViation {deviation}")
-                instrument.write(f"{ch}:FM:INTernal:FREQuency {mod_freq}")
-                instrument.write(f"{ch}:FM:STATe ON")
-            elif mod_type == "PM":
-                mod_freq = self.mod_freq_spin.value()
-                instrument.write(f"{ch}:PM:INTernal:FREQuency {mod_freq}")
-                instrument.write(f"{ch}:PM:STATe ON")
-            elif mod_type == "FSK":
-                instrument.write(f"{ch}:FSKey:STATe ON")
-            elif mod_type == "BPSK":
-                instrument.write(f"{ch}:BPSK:STATe ON")
-            elif mod_type == "Sweep":
-                instrument.write(f"{ch}:SWEep:STATe ON")
-            elif mod_type == "Burst":
-                instrument.write(f"{ch}:BURSt:STATe ON")
-        except Exception as e:
-            raise Exception(f"Modulation error: {str(e)}")
+        self._run_visa(resource_name, job, done, self.apply_btn)
 
-    def recall_config(self):
+    def _modulation_commands(self, mod_type):
+        """Build the modulation SCPI commands for the active channel — 33500B SCPI"""
+        ch = self._get_ch_prefix()
+        if mod_type == "AM":
+            depth = self.am_depth_spin.value()
+            mod_freq = self.mod_freq_spin.value()
+            return [f":{ch}:AM:DEPTh {depth}", f":{ch}:AM:INTernal:FREQuency {mod_freq}", f":{ch}:AM:STATe ON"]
+        if mod_type == "FM":
+            deviation = self.fm_dev_spin.value()
+            mod_freq = self.mod_freq_spin.value()
+            return [f":{ch}:FM:DEViation {deviation}", f":{ch}:FM:INTernal:FREQuency {mod_freq}", f":{ch}:FM:STATe ON"]
+        if mod_type == "PM":
+            mod_freq = self.mod_freq_spin.value()
+            return [f":{ch}:PM:INTernal:FREQuency {mod_freq}", f":{ch}:PM:STATe ON"]
+        if mod_type == "FSK":
+            return [f":{ch}:FSKey:STATe ON"]
+        if mod_type == "BPSK":
+            return [f":{ch}:BPSK:STATe ON"]
+        if mod_type == "Sweep":
+            return [f":{ch}:SWEep:STATe ON"]
+        if mod_type == "Burst":
+            return [f":{ch}:BURSt:STATe ON"]
+        return []
+
+    @require_visa
+    def recall_config(self, resource_name):
         """Recall configuration from instrument"""
-        resource_name = self.resource_combo.currentText().strip()
-        if not resource_name:
-            QMessageBox.warning(self, "No Resource", "Please select a VISA resource first.")
-            return
-        if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
-            return
-        try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
-            instrument.timeout = 5000
-            ch = self._get_ch_prefix()
+        ch_num = self.current_channel
+        query = f'{self._get_ch_prefix()}:FUNCtion?;FREQuency?;VOLTage?;VOLTage:OFFSet?;:{self._get_out_ch()}:STATe?'
+
+        def job(instrument):
+            func, freq, amp, offs, state = (field.strip() for field in instrument.query(query).strip().split(';'))
+            return func, freq, amp, offs, state
+
+        def done(success, payload, error):
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to recall configuration:\n{error}")
+                self.update_status_display(f"ERROR: Failed to recall config - {error}")
+                return
+            func, freq, amp, offs, state = payload
 
             settings = []
-            settings.append(f"CH{self.current_channel} Function: {instrument.query(f'{ch}:FUNCtion?').strip()}")
-            settings.append(f"CH{self.current_channel} Frequency: {instrument.query(f'{ch}:FREQuency?').strip()} Hz")
-            settings.append(f"CH{self.current_channel} Amplitude: {instrument.query(f'{ch}:VOLTage?').strip()} Vpp")
-            settings.append(f"CH{self.current_channel} Offset: {instrument.query(f'{ch}:VOLTage:OFFSet?').strip()} V")
-            out_ch = self._get_out_ch()
-            settings.append(f"CH{self.current_channel} Output: {instrument.query(f'{out_ch}:STATe?').strip()}")
-            instrument.close()
+            settings.append(f"CH{ch_num} Function: {func}")
+            settings.append(f"CH{ch_num} Frequency: {freq} Hz")
+            settings.append(f"CH{ch_num} Amplitude: {amp} Vpp")
+            settings.append(f"CH{ch_num} Offset: {offs} V")
+            settings.append(f"CH{ch_num} Output: {state}")
 
             status_msg = "Current instrument configuration:\n" + "\n".join(settings)
             self.update_status_display(status_msg)
             QMessageBox.information(self, "Configuration", status_msg)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to recall configuration:\n{str(e)}")
-            self.update_status_display(f"ERROR: Failed to recall config - {str(e)}")
 
-    def reset_instrument(self):
+        self._run_visa(resource_name, job, done, self.recall_btn)
+
+    @require_visa
+    def reset_instrument(self, resource_name):
         """Reset instrument to default state"""
         reply = QMessageBox.question(
             self, "Confirm Reset",
@@ -1008,26 +1421,24 @@ class Keysight33500BGeneratorGUI(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        resource_name = self.resource_combo.currentText().strip()
-        if not resource_name:
-            QMessageBox.warning(self, "No Resource", "Please select a VISA resource first.")
-            return
-        if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
-            return
-        try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
-            instrument.timeout = 5000
-            instrument.write("*RST")
-            time.sleep(2)
-            instrument.close()
+        def job(instrument):
+            # *OPC? answers as soon as the reset has completed
+            instrument.timeout = 10000
+            try:
+                instrument.query("*RST;*OPC?")
+            finally:
+                instrument.timeout = 5000
+
+        def done(success, payload, error):
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to reset instrument:\n{error}")
+                self.update_status_display(f"ERROR: Failed to reset instrument - {error}")
+                return
             self.update_status_display("Instrument reset to default settings.")
             self.status_bar.showMessage("✅ Instrument reset successfully")
             QMessageBox.information(self, "Success", "Instrument reset successfully!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to reset instrument:\n{str(e)}")
-            self.update_status_display(f"ERROR: Failed to reset instrument - {str(e)}")
+
+        self._run_visa(resource_name, job, done, self.reset_btn)
 
     def refresh_resources(self):
         """Refresh available VISA resources"""
@@ -1035,51 +1446,61 @@ class Keysight33500BGeneratorGUI(QMainWindow):
             QMessageBox.warning(self, "PyVISA Not Available",
                                 "PyVISA is not installed. Install with:\npip install pyvisa pyvisa-py")
             return
-        try:
-            rm = pyvisa.ResourceManager()
-            resources = rm.list_resources()
-            self.resource_combo.clear()
-            if resources:
-                self.resource_combo.addItems(resources)
-                self.status_bar.showMessage(f"✅ Found {len(resources)} VISA resource(s)")
-                self.update_status_display(f"Found {len(resources)} VISA resources:\n" + "\n".join(resources))
-            else:
-                self.status_bar.showMessage("⚠️ No VISA resources found")
-                self.update_status_display("No VISA resources found. Check connections.")
-                QMessageBox.information(self, "No Resources", "No VISA resources detected.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to scan for resources:\n{str(e)}")
-            self.update_status_display(f"ERROR: Failed to scan resources - {str(e)}")
+        # A scan can take seconds; reuse a recent result instead of rescanning
+        if self._res_cache is not None and time.monotonic() - self._res_cache[0] < RESOURCE_CACHE_SECONDS:
+            self._show_resources(self._res_cache[1])
+            return
+
+        def task():
+            self._visa_lock.lock()
+            try:
+                return tuple(self._get_resource_manager().list_resources())
+            finally:
+                self._release_visa_lock()
+
+        def done(success, resources, error):
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to scan for resources:\n{error}")
+                self.update_status_display(f"ERROR: Failed to scan resources - {error}")
+                return
+            self._res_cache = (time.monotonic(), resources)
+            self._show_resources(resources)
+
+        self.status_bar.showMessage("🔍 Scanning for VISA resources...")
+        self._start_worker(task, done, self.refresh_btn)
+
+    def _show_resources(self, resources):
+        """Fill the resource combo with a scan result"""
+        self.resource_combo.clear()
+        if resources:
+            self.resource_combo.addItems(resources)
+            self.status_bar.showMessage(f"✅ Found {len(resources)} VISA resource(s)")
+            self.update_status_display(f"Found {len(resources)} VISA resources:\n" + "\n".join(resources))
+        else:
+            self.status_bar.showMessage("⚠️ No VISA resources found")
+            self.update_status_display("No VISA resources found. Check connections.")
+            QMessageBox.information(self, "No Resources", "No VISA resources detected.")
 
-    def test_connection(self):
+    @require_visa
+    def test_connection(self, resource_name):
         """Test connection to selected instrument"""
-        resource_name = self.resource_combo.currentText().strip()
-        if not resource_name:
-            QMessageBox.warning(self, "No Resource", "Please select or enter a VISA resource address.")
-            return
-        if not PYVISA_AVAILABLE:
-            QMessageBox.warning(self, "PyVISA Not Available", "PyVISA is not installed.")
-            return
-        try:
-            rm = pyvisa.ResourceManager()
-            instrument = rm.open_resource(resource_name)
-            instrument.timeout = 5000
-            idn = instrument.query("*IDN?").strip()
-            instrument.close()
+        def done(success, idn, error):
+            if not success:
+                self.status_bar.showMessage("❌ Connection failed")
+                self.update_status_display(f"Connection failed: {error}")
+                QMessageBox.critical(self, "Connection Failed", f"Could not connect.\n\nError:\n{error}")
+                return
             self.status_bar.showMessage("✅ Connection successful!")
             self.update_status_display(f"Connection successful!\nInstrument ID: {idn}")
             QMessageBox.information(self, "Connection Test", f"Successfully connected!\n\nInstrument ID:\n{idn}")
-        except Exception as e:
-            self.status_bar.showMessage("❌ Connection failed")
-            self.update_status_display(f"Connection failed: {str(e)}")
-            QMessageBox.critical(self, "Connection Failed", f"Could not connect.\n\nError:\n{str(e)}")
+
+        self._run_visa(resource_name, lambda instrument: instrument.query("*IDN?").strip(), done, self.test_btn)
 
     def update_status_display(self, message):
         """Update status display with timestamp"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        current_text = self.status_text.toPlainText()
-        new_entry = f"[{timestamp}] {message}\n"
-        self.status_text.setPlainText(new_entry + ("=" * 60) + "\n" + current_text)
+        self._status_log.appendleft(f"[{timestamp}] {message}\n")
+        self.status_text.setPlainText((("=" * 60) + "\n").join(self._status_log))
 
     def check_dependencies(self):
         """Check if required dependencies are available"""
@@ -1090,71 +1511,16 @@ class Keysight33500BGeneratorGUI(QMainWindow):
 
     # ── Styling ────────────────────────────────────────────────────
     def set_light_theme(self):
+        # One window-level sheet styles every group box, spinbox, input and radio,
+        # so Qt parses these rules once instead of once per widget. The widget
+        # rules come after the QWidget defaults so they win on equal specificity.
         self.setStyleSheet("""
             QMainWindow { background-color: #ffffff; }
             QWidget { background-color: #ffffff; color: #3c4043; }
-        """)
-
-    def get_groupbox_style(self):
-        return """
-            QGroupBox {
-                background-color: #ffffff;
-                border: 2px solid #e8eaed;
-                border-radius: 10px;
-                margin-top: 12px;
-                padding: 15px;
-                font-weight: bold;
-                color: #1a73e8;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px;
-                background-color: #ffffff;
-            }
-        """
+        """ + _GROUPBOX_QSS + _SPINBOX_QSS + _INPUT_QSS + _RADIO_QSS)
 
     def get_button_style(self, color):
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-weight: bold;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{ background-color: {color}; opacity: 0.9; }}
-            QPushButton:pressed {{ background-color: {color}; }}
-        """
-
-    def get_spinbox_style(self):
-        return """
-            QSpinBox, QDoubleSpinBox {
-                border: 2px solid #dadce0;
-                border-radius: 6px;
-                padding: 6px;
-                background-color: #ffffff;
-                color: #3c4043;
-                font-size: 10px;
-            }
-            QSpinBox:focus, QDoubleSpinBox:focus { border: 2px solid #1a73e8; }
-        """
-
-    def get_input_style(self):
-        return """
-            QComboBox, QLineEdit {
-                border: 2px solid #dadce0;
-                border-radius: 6px;
-                padding: 6px;
-                background-color: #ffffff;
-                color: #3c4043;
-                font-size: 10px;
-            }
-            QComboBox:focus, QLineEdit:focus { border: 2px solid #1a73e8; }
-            QComboBox::drop-down { border: none; padding-right: 8px; }
-        """
+        return _button_qss(color)
 
 
 def main():